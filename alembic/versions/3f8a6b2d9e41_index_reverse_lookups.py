@@ -0,0 +1,41 @@
+# pylint: disable=invalid-name
+"""index_reverse_lookups
+
+Revision ID: 3f8a6b2d9e41
+Revises: 9c1d2e7f4a3b
+Create Date: 2024-06-05 09:41:17.502318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8a6b2d9e41"
+down_revision: Union[str, None] = "9c1d2e7f4a3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# pylint: disable=no-member
+def upgrade() -> None:
+    """Index the columns looked up without the leading primary key column."""
+    op.create_index(
+        "ix_semantic_relations_target_concept_iri",
+        "semantic_relations",
+        ["target_concept_iri"],
+    )
+    op.create_index("ix_in_scheme_member_iri", "in_scheme", ["member_iri"])
+    op.create_index("ix_in_collection_member_iri", "in_collection", ["member_iri"])
+
+
+# pylint: disable=no-member
+def downgrade() -> None:
+    """Drop the reverse lookup indices."""
+    op.drop_index("ix_in_collection_member_iri", table_name="in_collection")
+    op.drop_index("ix_in_scheme_member_iri", table_name="in_scheme")
+    op.drop_index(
+        "ix_semantic_relations_target_concept_iri",
+        table_name="semantic_relations",
+    )
@@ -0,0 +1,50 @@
+# pylint: disable=invalid-name
+"""add_localized_views
+
+Revision ID: 9c1d2e7f4a3b
+Revises: 5233d5762475
+Create Date: 2024-06-03 10:12:45.381920
+
+"""
+
+from typing import Sequence, Union
+
+from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1d2e7f4a3b"
+down_revision: Union[str, None] = "5233d5762475"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# pylint: disable=no-member
+def upgrade() -> None:
+    """Create the precomputed concept schemes and concepts payload tables."""
+    op.create_table(
+        "concept_schemes_view",
+        Column("lang", String(), primary_key=True),
+        Column("payload", JSONB(), nullable=False),
+    )
+
+    op.create_table(
+        "concepts_view",
+        Column(
+            "concept_scheme_iri",
+            String(),
+            ForeignKey("concept_schemes.iri"),
+            primary_key=True,
+        ),
+        Column("lang", String(), primary_key=True),
+        Column("payload", JSONB(), nullable=False),
+    )
+
+
+# pylint: disable=no-member
+def downgrade() -> None:
+    """Drop the precomputed concept schemes and concepts payload tables."""
+    op.drop_table("concepts_view")
+    op.drop_table("concept_schemes_view")
@@ -0,0 +1,35 @@
+# pylint: disable=invalid-name
+"""add_datasets_generation
+
+Revision ID: b7e4c2a91d5f
+Revises: 3f8a6b2d9e41
+Create Date: 2024-06-07 14:26:03.918254
+
+"""
+
+from typing import Sequence, Union
+
+from sqlalchemy import Column, String
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4c2a91d5f"
+down_revision: Union[str, None] = "3f8a6b2d9e41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# pylint: disable=no-member
+def upgrade() -> None:
+    """Create the datasets generation table."""
+    op.create_table(
+        "datasets_generation",
+        Column("generation", String(), primary_key=True),
+    )
+
+
+# pylint: disable=no-member
+def downgrade() -> None:
+    """Drop the datasets generation table."""
+    op.drop_table("datasets_generation")
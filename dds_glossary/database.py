@@ -1,13 +1,90 @@
 """Database classes for the dds_glossary package."""
 
+from functools import lru_cache
+from gzip import compress as gzip_compress
+from hashlib import blake2b
 from os import getenv as os_getenv
-
-from sqlalchemy import create_engine
+from typing import Any, Final, Iterable
+from uuid import uuid4
+
+from orjson import OPT_NON_STR_KEYS
+from orjson import dumps as orjson_dumps
+from orjson import loads as orjson_loads
+from sqlalchemy import (
+    ColumnElement,
+    Table,
+    Text,
+    case,
+    cast,
+    create_engine,
+    func,
+    insert,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, joinedload, with_polymorphic
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    Session,
+    joinedload,
+    selectinload,
+    with_polymorphic,
+)
+from sqlalchemy.pool import NullPool
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
-from .model import Base, Collection, Concept, ConceptScheme, Member, SemanticRelation
+from .model import (
+    Base,
+    Collection,
+    Concept,
+    ConceptScheme,
+    ConceptSchemesView,
+    ConceptsView,
+    DatasetsGeneration,
+    Member,
+    SemanticRelation,
+    in_collection,
+    in_scheme,
+)
+from .settings import get_settings
+
+PAYLOAD_CACHE_SIZE: Final[int] = 512
+POOL_OPTIONS: Final[dict] = {
+    "pool_size": 20,
+    "max_overflow": 40,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+
+def get_engine_options() -> dict:
+    """
+    Get the connection pool options of the database engine. If the
+    `DATABASE_NULL_POOL` setting is enabled, connections are not pooled by the
+    engine, which is the expected setup behind PgBouncer in transaction mode.
+
+    Returns:
+        dict: The keyword arguments to pass to `create_engine`.
+    """
+    if get_settings().DATABASE_NULL_POOL:
+        return {"poolclass": NullPool}
+    return POOL_OPTIONS
+
+
+def json_serializer(value: object) -> str:
+    """
+    Serialize a value of a JSONB column with orjson. Non-string keys, such as the
+    missing language of a label, are converted to strings like `json.dumps` does.
+
+    Args:
+        value (object): The value to serialize.
+
+    Returns:
+        str: The JSON document.
+    """
+    return orjson_dumps(value, option=OPT_NON_STR_KEYS).decode()
 
 
 def init_engine(
@@ -17,7 +94,8 @@ def init_engine(
     """
     Initialize the database engine. If the database does not exist, create it.
     If the drop_database_flag is set, drop the database if it exists. Create the
-    tables if they do not exist.
+    tables if they do not exist. The engine uses the pool options returned by
+    `get_engine_options`.
 
     Args:
         database_url (str, optional): The database URL. If None, use the
@@ -35,7 +113,12 @@ def init_engine(
         database_url = os_getenv("DATABASE_URL")
     if not database_url:
         raise ValueError("DATABASE_URL environment variable is not set.")
-    engine = create_engine(database_url)
+    engine = create_engine(
+        database_url,
+        json_serializer=json_serializer,
+        json_deserializer=orjson_loads,
+        **get_engine_options(),
+    )
 
     if not database_exists(engine.url):
         create_database(engine.url)
@@ -47,12 +130,43 @@ def init_engine(
     return engine
 
 
+def copy_rows(session: Session, table: Table, rows: Iterable[dict]) -> None:
+    """
+    Write rows to a table with a PostgreSQL `COPY ... FROM STDIN` statement, within
+    the transaction of the session. The values go through the bind processors of the
+    column types, as they would in an INSERT statement.
+
+    Args:
+        session (Session): The database session.
+        table (Table): The table to write to.
+        rows (Iterable[dict]): The rows, by column name.
+    """
+    dialect = session.get_bind().dialect
+    preparer = dialect.identifier_preparer
+    columns = list(table.columns)
+    processors = [column.type.bind_processor(dialect) for column in columns]
+    statement = (
+        f"COPY {preparer.format_table(table)} "
+        f"({', '.join(preparer.quote(column.name) for column in columns)}) FROM STDIN"
+    )
+    driver_connection: Any = session.connection().connection.driver_connection
+    with driver_connection.cursor() as cursor:
+        with cursor.copy(statement) as copy:
+            for row in rows:
+                copy.write_row(
+                    [
+                        processor(row[column.name]) if processor else row[column.name]
+                        for column, processor in zip(columns, processors)
+                    ]
+                )
+
+
 def save_dataset(
     engine: Engine,
     concept_schemes: list[ConceptScheme],
     concepts: list[Concept],
     collections: list[Collection],
-    semantic_relations: list[SemanticRelation],
+    semantic_relation_rows: list[dict],
 ) -> None:
     """
     Save a dataset in the database.
@@ -62,22 +176,332 @@ def save_dataset(
         concept_schemes (list[ConceptScheme]): The concept schemes.
         concepts (list[Concept]): The concepts.
         collections (list[Collection]): The collections.
-        semantic_relations (list[SemanticRelation]): The semantic relations.
+        semantic_relation_rows (list[dict]): The semantic relation rows, as yielded
+            by `SemanticRelation.iter_relation_rows`.
     """
+    members_by_iri: dict[str, Member] = {
+        member.iri: member for member in [*concepts, *collections]
+    }
     with Session(engine) as session:
-        session.add_all(concept_schemes)
-        session.add_all(concepts)
-        session.add_all(collections)
-        session.add_all(semantic_relations)
-
-        members: list[Member] = []
-        members.extend(concepts)
-        members.extend(collections)
-        for collection in collections:
-            collection.resolve_members_from_xml(members)
+        for model, instances in (
+            (ConceptScheme, concept_schemes),
+            (Concept, concepts),
+            (Collection, collections),
+        ):
+            if instances:
+                session.execute(
+                    insert(model), [instance.get_row() for instance in instances]
+                )
+        copy_rows(
+            session,
+            Base.metadata.tables[SemanticRelation.__tablename__],
+            semantic_relation_rows,
+        )
+        copy_rows(
+            session,
+            in_scheme,
+            ConceptScheme.iter_in_scheme_rows([*concepts, *collections]),
+        )
+        copy_rows(
+            session,
+            in_collection,
+            (
+                row
+                for collection in collections
+                for row in collection.iter_in_collection_rows(members_by_iri)
+            ),
+        )
         session.commit()
 
 
+def save_views(engine: Engine) -> None:
+    """
+    Precompute and save the concept schemes and concepts payloads for every language
+    available in the saved datasets. A payload is always saved for English, which is
+    the fallback language of the labels. The datasets generation is renewed with the
+    views, so that every worker stops serving its cached responses, and the cached
+    payloads of this process are dropped once the new ones are committed.
+
+    Args:
+        engine (Engine): The database engine.
+    """
+    with Session(engine) as session:
+        session.query(ConceptsView).delete()
+        session.query(ConceptSchemesView).delete()
+        member_polymorphic = with_polymorphic(
+            Member,
+            [Concept, Collection],
+            aliased=True,
+        )
+        concept_schemes = (
+            session.query(ConceptScheme)
+            .options(selectinload(ConceptScheme.members.of_type(member_polymorphic)))
+            .all()
+        )
+
+        langs = {"en"}
+        for concept_scheme in concept_schemes:
+            langs.update(concept_scheme.prefLabels)
+        session.add_all(
+            ConceptSchemesView(
+                lang=lang,
+                payload=[
+                    concept_scheme.to_dict(lang=lang)
+                    for concept_scheme in concept_schemes
+                ],
+            )
+            for lang in langs
+        )
+
+        for concept_scheme in concept_schemes:
+            concepts = [
+                member
+                for member in concept_scheme.members
+                if isinstance(member, Concept)
+            ]
+            langs = {"en"}
+            for concept in concepts:
+                langs.update(concept.prefLabels)
+                langs.update(concept.altLabels)
+                langs.update(concept.scopeNotes)
+            session.add_all(
+                ConceptsView(
+                    concept_scheme_iri=concept_scheme.iri,
+                    lang=lang,
+                    payload=[concept.to_dict(lang=lang) for concept in concepts],
+                )
+                for lang in langs
+            )
+        session.query(DatasetsGeneration).delete()
+        session.add(DatasetsGeneration(generation=uuid4().hex))
+        session.commit()
+    load_concept_schemes_payload.cache_clear()
+    load_concepts_payload.cache_clear()
+    get_payload_etag.cache_clear()
+    get_payload_gzip.cache_clear()
+
+
+def get_datasets_generation(engine: Engine) -> str | None:
+    """
+    Get the generation of the saved datasets, which is renewed whenever the views are
+    saved. The cached responses are keyed on it, so that a reload in any worker
+    invalidates the cached responses of all the others.
+
+    Args:
+        engine (Engine): The database engine.
+
+    Returns:
+        str | None: The datasets generation, or None if the views have not been
+            saved.
+    """
+    with Session(engine) as session:
+        return session.scalars(select(DatasetsGeneration.generation)).one_or_none()
+
+
+def get_concept_schemes_payload(engine: Engine, lang: str = "en") -> str | None:
+    """
+    Get the precomputed concept schemes payload from the database, as a JSON string.
+    If there is no payload in the specified language, return the English one. The
+    payloads are cached by their stored language and datasets generation, while
+    missing payloads are not cached.
+
+    Args:
+        engine (Engine): The database engine.
+        lang (str): The language of the payload. Defaults to "en".
+
+    Returns:
+        str | None: The JSON payload, or None if it has not been precomputed.
+    """
+    try:
+        return load_concept_schemes_payload(
+            engine,
+            *get_concept_schemes_payload_key(engine, lang),
+        )
+    except NoResultFound:
+        return None
+
+
+def get_concept_schemes_payload_key(engine: Engine, lang: str) -> tuple[str, str]:
+    """
+    Get the key of the precomputed concept schemes payload to return for the
+    specified language: the language itself if it has a payload, else English, and
+    the datasets generation.
+
+    Args:
+        engine (Engine): The database engine.
+        lang (str): The requested language.
+
+    Returns:
+        tuple[str, str]: The language of the stored payload and the datasets
+            generation.
+
+    Raises:
+        NoResultFound: If the payload has not been precomputed.
+    """
+    with Session(engine) as session:
+        stored_lang, generation = session.execute(
+            select(ConceptSchemesView.lang, DatasetsGeneration.generation)
+            .join(DatasetsGeneration, true())
+            .where(ConceptSchemesView.lang.in_((lang, "en")))
+            .order_by(ConceptSchemesView.lang != lang)
+            .limit(1)
+        ).one()
+        return stored_lang, generation
+
+
+@lru_cache(maxsize=PAYLOAD_CACHE_SIZE)
+def load_concept_schemes_payload(engine: Engine, lang: str, generation: str) -> str:
+    """
+    Load the precomputed concept schemes payload from the database, as a JSON
+    string.
+
+    Args:
+        engine (Engine): The database engine.
+        lang (str): The stored language of the payload.
+        generation (str): The datasets generation of the payload.
+
+    Returns:
+        str: The JSON payload.
+
+    Raises:
+        NoResultFound: If the payload has not been precomputed, or if the datasets
+            have been saved again since the generation.
+    """
+    with Session(engine) as session:
+        return session.scalars(
+            select(cast(ConceptSchemesView.payload, Text))
+            .join(DatasetsGeneration, DatasetsGeneration.generation == generation)
+            .where(ConceptSchemesView.lang == lang)
+        ).one()
+
+
+def get_concepts_payload(
+    engine: Engine,
+    concept_scheme_iri: str,
+    lang: str = "en",
+) -> str | None:
+    """
+    Get the precomputed concepts payload of a concept scheme from the database, as a
+    JSON string. If there is no payload in the specified language, return the English
+    one. The payloads are cached by their stored language and datasets generation,
+    while missing payloads are not cached.
+
+    Args:
+        engine (Engine): The database engine.
+        concept_scheme_iri (str): The concept scheme IRI.
+        lang (str): The language of the payload. Defaults to "en".
+
+    Returns:
+        str | None: The JSON payload, or None if it has not been precomputed.
+    """
+    try:
+        return load_concepts_payload(
+            engine,
+            concept_scheme_iri,
+            *get_concepts_payload_key(engine, concept_scheme_iri, lang),
+        )
+    except NoResultFound:
+        return None
+
+
+def get_concepts_payload_key(
+    engine: Engine,
+    concept_scheme_iri: str,
+    lang: str,
+) -> tuple[str, str]:
+    """
+    Get the key of the precomputed concepts payload of a concept scheme to return for
+    the specified language: the language itself if it has a payload, else English,
+    and the datasets generation.
+
+    Args:
+        engine (Engine): The database engine.
+        concept_scheme_iri (str): The concept scheme IRI.
+        lang (str): The requested language.
+
+    Returns:
+        tuple[str, str]: The language of the stored payload and the datasets
+            generation.
+
+    Raises:
+        NoResultFound: If the payload has not been precomputed.
+    """
+    with Session(engine) as session:
+        stored_lang, generation = session.execute(
+            select(ConceptsView.lang, DatasetsGeneration.generation)
+            .join(DatasetsGeneration, true())
+            .where(ConceptsView.concept_scheme_iri == concept_scheme_iri)
+            .where(ConceptsView.lang.in_((lang, "en")))
+            .order_by(ConceptsView.lang != lang)
+            .limit(1)
+        ).one()
+        return stored_lang, generation
+
+
+@lru_cache(maxsize=PAYLOAD_CACHE_SIZE)
+def load_concepts_payload(
+    engine: Engine,
+    concept_scheme_iri: str,
+    lang: str,
+    generation: str,
+) -> str:
+    """
+    Load the precomputed concepts payload of a concept scheme from the database, as
+    a JSON string.
+
+    Args:
+        engine (Engine): The database engine.
+        concept_scheme_iri (str): The concept scheme IRI.
+        lang (str): The stored language of the payload.
+        generation (str): The datasets generation of the payload.
+
+    Returns:
+        str: The JSON payload.
+
+    Raises:
+        NoResultFound: If the payload has not been precomputed, or if the datasets
+            have been saved again since the generation.
+    """
+    with Session(engine) as session:
+        return session.scalars(
+            select(cast(ConceptsView.payload, Text))
+            .join(DatasetsGeneration, DatasetsGeneration.generation == generation)
+            .where(ConceptsView.concept_scheme_iri == concept_scheme_iri)
+            .where(ConceptsView.lang == lang)
+        ).one()
+
+
+@lru_cache(maxsize=PAYLOAD_CACHE_SIZE)
+def get_payload_etag(payload: str) -> str:
+    """
+    Get the weak entity tag of a precomputed payload, from its BLAKE2 digest. The
+    tags are cached until the views are saved again.
+
+    Args:
+        payload (str): The JSON payload.
+
+    Returns:
+        str: The weak entity tag.
+    """
+    return f'W/"{blake2b(payload.encode(), digest_size=16).hexdigest()}"'
+
+
+@lru_cache(maxsize=PAYLOAD_CACHE_SIZE)
+def get_payload_gzip(payload: str, compresslevel: int) -> bytes:
+    """
+    Get the gzip compressed body of a precomputed payload. The bodies are cached until
+    the views are saved again.
+
+    Args:
+        payload (str): The JSON payload.
+        compresslevel (int): The gzip compression level.
+
+    Returns:
+        bytes: The compressed payload.
+    """
+    return gzip_compress(payload.encode(), compresslevel=compresslevel)
+
+
 def get_concept_schemes(engine: Engine) -> list[ConceptScheme]:
     """
     Get the concept schemes from the database.
@@ -193,6 +617,40 @@ def get_relations(engine: Engine, concept_iri: str) -> list[SemanticRelation]:
         )
 
 
+def in_language(
+    attribute: InstrumentedAttribute,
+    lang: str = "en",
+    as_text: bool = True,
+) -> ColumnElement:
+    """
+    Build the SQL expression of a JSONB attribute in the specified language. If the
+    attribute is not available in the specified language, the expression falls back
+    to English, and then to an empty value. A label present without a value is kept
+    as a null value, without falling back. This is the SQL counterpart of
+    `Base.get_in_language` and `Base.get_in_language_list`.
+
+    Args:
+        attribute (InstrumentedAttribute): The JSONB attribute.
+        lang (str): The language code of the attribute. Defaults to "en".
+        as_text (bool): Flag to return the value as text instead of JSONB. Defaults
+            to True.
+
+    Returns:
+        ColumnElement: The SQL expression.
+    """
+    if as_text:
+        return case(
+            (attribute.has_key(lang), attribute[lang].astext),
+            (attribute.has_key("en"), attribute["en"].astext),
+            else_="",
+        )
+    return case(
+        (attribute.has_key(lang), attribute[lang]),
+        (attribute.has_key("en"), attribute["en"]),
+        else_=cast("[]", JSONB),
+    )
+
+
 def search_database(
     engine: Engine,
     search_term: str,
@@ -211,10 +669,13 @@ def search_database(
         list[Concept]: The concepts that matches the search term.
     """
     with Session(engine) as session:
-        concepts = session.query(Concept).all()
-        return [
-            concept
-            for concept in concepts
-            if search_term in concept.get_in_language(concept.prefLabels, lang)
-            or search_term in concept.get_in_language(concept.altLabels, lang)
-        ]
+        return (
+            session.query(Concept)
+            .where(
+                (func.strpos(in_language(Concept.prefLabels, lang), search_term) > 0)
+                | in_language(Concept.altLabels, lang, as_text=False).contains(
+                    [search_term]
+                )
+            )
+            .all()
+        )
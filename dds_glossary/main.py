@@ -1,16 +1,42 @@
 """Main entry for the dds_glossary server."""
 
 import argparse
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 import sentry_sdk
 import uvicorn
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi_versioning import VersionedFastAPI
 
-from .routes import router_non_versioned, router_versioned
+from .routes import (
+    GZIP_COMPRESS_LEVEL,
+    GZIP_MINIMUM_SIZE,
+    router_non_versioned,
+    router_versioned,
+)
+from .services import GlossaryController
 from .settings import get_settings
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[dict[str, GlossaryController]]:
+    """Create the glossary controller once per worker, and share it with the
+    requests through the lifespan state. The database engine is disposed on
+    shutdown.
+
+    Args:
+        _app (FastAPI): The application object.
+
+    Yields:
+        dict[str, GlossaryController]: The lifespan state.
+    """
+    controller = GlossaryController()
+    yield {"controller": controller}
+    controller.engine.dispose()
+
+
 def create_app() -> FastAPI:
     """Create the FastAPI application object
     Returns:
@@ -29,8 +55,18 @@ def create_app() -> FastAPI:
 
     app = FastAPI()
     app.include_router(router_versioned)
-    app = VersionedFastAPI(app, enable_latest=True, default_version=(0, 1))
+    app = VersionedFastAPI(
+        app,
+        enable_latest=True,
+        default_version=(0, 1),
+        lifespan=lifespan,
+    )
     app.include_router(router_non_versioned)
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=GZIP_MINIMUM_SIZE,
+        compresslevel=GZIP_COMPRESS_LEVEL,
+    )
 
     return app
 
@@ -1,24 +1,62 @@
 """Model classes for the dds_glossary package."""
 
 from abc import abstractmethod
-from typing import ClassVar
+from dataclasses import dataclass
+from typing import ClassVar, Final, Iterable, Iterator
 
-from pydantic import BaseModel
 from sqlalchemy import Column, ForeignKey, String, Table
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from .enums import MemberType, SemanticRelationType
 from .xml import (
-    get_element_attribute,
+    DC_NAMESPACE,
+    RDF_RESOURCE,
+    SKOS_NAMESPACE,
+    get_element_iri,
     get_sub_element_as_str,
     get_sub_element_attributes,
     get_sub_elements_as_dict,
     get_sub_elements_as_dict_of_lists,
+    scan_children,
+)
+
+ALT_LABEL_TAG: Final[str] = f"{SKOS_NAMESPACE}altLabel"
+IDENTIFIER_TAG: Final[str] = f"{DC_NAMESPACE}identifier"
+IN_SCHEME_TAG: Final[str] = f"{SKOS_NAMESPACE}inScheme"
+MEMBER_TAG: Final[str] = f"{SKOS_NAMESPACE}member"
+NOTATION_TAG: Final[str] = f"{SKOS_NAMESPACE}notation"
+PREF_LABEL_TAG: Final[str] = f"{SKOS_NAMESPACE}prefLabel"
+SCOPE_NOTE_TAG: Final[str] = f"{SKOS_NAMESPACE}scopeNote"
+RELATION_TYPES_BY_TAG: Final[dict[str, SemanticRelationType]] = {
+    f"{SKOS_NAMESPACE}{relation_type.value}": relation_type
+    for relation_type in SemanticRelationType
+}
+CONCEPT_SCHEME_CHILD_TAGS: Final[tuple[str, ...]] = (
+    NOTATION_TAG,
+    SCOPE_NOTE_TAG,
+    PREF_LABEL_TAG,
+)
+COLLECTION_CHILD_TAGS: Final[tuple[str, ...]] = (
+    NOTATION_TAG,
+    PREF_LABEL_TAG,
+    IN_SCHEME_TAG,
+    MEMBER_TAG,
+)
+SEMANTIC_RELATION_CHILD_TAGS: Final[tuple[str, ...]] = tuple(RELATION_TYPES_BY_TAG)
+CONCEPT_CHILD_TAGS: Final[tuple[str, ...]] = (
+    IDENTIFIER_TAG,
+    NOTATION_TAG,
+    PREF_LABEL_TAG,
+    ALT_LABEL_TAG,
+    SCOPE_NOTE_TAG,
+    IN_SCHEME_TAG,
+    *SEMANTIC_RELATION_CHILD_TAGS,
 )
 
 
-class Dataset(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Dataset:
     """
     Base class for the datasets.
 
@@ -31,6 +69,7 @@ class Dataset(BaseModel):
     url: str
 
 
+@dataclass(frozen=True, slots=True)
 class FailedDataset(Dataset):
     """
     Class for the failed datasets.
@@ -46,15 +85,37 @@ class Base(DeclarativeBase):
     """Base class for all models."""
 
     type_annotation_map: ClassVar[dict] = {
-        dict[str, str]: JSONB,
+        dict[str, str | None]: JSONB,
         dict[str, list[str]]: JSONB,
+        list[dict]: JSONB,
     }
 
     def __eq__(self, other: object) -> bool:
-        return self.to_dict() == other.to_dict()  # type: ignore
+        if self is other:
+            return True
+        if not isinstance(other, Base):
+            return NotImplemented
+        if type(self) is not type(other):
+            return False
+        return all(
+            getattr(self, column.key) == getattr(other, column.key)
+            for column in self.__mapper__.column_attrs
+        )
+
+    def get_row(self) -> dict:
+        """
+        Return the mapped column values of the instance, to be used in bulk inserts.
+
+        Returns:
+            dict: The column values, by attribute name.
+        """
+        return {
+            column.key: getattr(self, column.key)
+            for column in self.__mapper__.column_attrs
+        }
 
     @staticmethod
-    def get_in_language(attribute: dict, lang: str = "en") -> str:
+    def get_in_language(attribute: dict, lang: str = "en") -> str | None:
         """
         Get the value of the attribute in the specified language. If the attribute is
         not available in the specified language, return the attribute in English. If the
@@ -65,10 +126,10 @@ class Base(DeclarativeBase):
             lang (str): The language code of the attribute. Defaults to English ("en").
 
         Returns:
-            str: The attribute in the specified language if available, otherwise in
-                English.
+            str | None: The attribute in the specified language if available, otherwise
+                in English. None if the language is available without a value.
         """
-        return attribute.get(lang, attribute.get("en", ""))
+        return attribute[lang] if lang in attribute else attribute.get("en", "")
 
     @staticmethod
     def get_in_language_list(attribute: dict, lang: str = "en") -> list[str]:
@@ -85,7 +146,7 @@ class Base(DeclarativeBase):
             list[str]: The attribute in the specified language if available,
                 otherwise in English.
         """
-        return attribute.get(lang, attribute.get("en", []))
+        return attribute[lang] if lang in attribute else attribute.get("en", [])
 
     @abstractmethod
     def to_dict(self) -> dict:
@@ -114,10 +175,10 @@ class ConceptScheme(Base):
         iri (str): The Internationalized Resource Identifier of the concept scheme.
         notation (str): The notation of the concept scheme.
         scopeNote (str): The scope note of the concept scheme.
-        prefLabels (dict[str, str]): The preferred labels of the concept scheme. This
-            is a dictionary where the key is the language code and the value is the
-            label in that language. To get the preferred label in a specific language,
-            use the `get_in_language` method.
+        prefLabels (dict[str, str | None]): The preferred labels of the concept scheme.
+            This is a dictionary where the key is the language code and the value is
+            the label in that language. To get the preferred label in a specific
+            language, use the `get_in_language` method.
         members (list[Member]): The members of the concept scheme.
     """
 
@@ -126,7 +187,7 @@ class ConceptScheme(Base):
     iri: Mapped[str] = mapped_column(primary_key=True)
     notation: Mapped[str] = mapped_column()
     scopeNote: Mapped[str] = mapped_column()
-    prefLabels: Mapped[dict[str, str]] = mapped_column()
+    prefLabels: Mapped[dict[str, str | None]] = mapped_column()
 
     members: Mapped[list["Member"]] = relationship(
         "Member",
@@ -135,23 +196,71 @@ class ConceptScheme(Base):
     )
 
     @classmethod
-    def from_xml_element(cls, element) -> "ConceptScheme":
+    def iter_in_scheme_rows(cls, members: Iterable["Member"]) -> Iterator[dict]:
         """
-        Return a ConceptScheme instance from an XML element.
+        Yield the rows of the `in_scheme` association table for the members.
+
+        Args:
+            members (Iterable[Member]): The members, with their concept schemes.
+
+        Yields:
+            dict: The association rows.
+        """
+        for member in members:
+            for concept_scheme in member.concept_schemes:
+                yield {"scheme_iri": concept_scheme.iri, "member_iri": member.iri}
+
+    @classmethod
+    def parse_xml_element(cls, element) -> dict:
+        """
+        Collect the data of a ConceptScheme from an XML element.
 
         Args:
             element (ElementBase): The XML element to parse.
 
+        Returns:
+            dict: The parsed data, to be passed to `from_parsed_dict`.
+        """
+        children = scan_children(element, CONCEPT_SCHEME_CHILD_TAGS)
+        return {
+            "iri": get_element_iri(element),
+            "notation": get_sub_element_as_str(children, NOTATION_TAG),
+            "scopeNote": get_sub_element_as_str(children, SCOPE_NOTE_TAG),
+            "prefLabels": get_sub_elements_as_dict(children, PREF_LABEL_TAG),
+        }
+
+    @classmethod
+    def from_parsed_dict(cls, data: dict) -> "ConceptScheme":
+        """
+        Return a ConceptScheme instance from the data collected by
+        `parse_xml_element`.
+
+        Args:
+            data (dict): The parsed data.
+
         Returns:
             ConceptScheme: The parsed ConceptScheme instance.
         """
         return ConceptScheme(
-            iri=get_element_attribute(element, "about"),
-            notation=get_sub_element_as_str(element, "core:notation"),
-            scopeNote=get_sub_element_as_str(element, "core:scopeNote"),
-            prefLabels=get_sub_elements_as_dict(element, "core:prefLabel"),
+            iri=data["iri"],
+            notation=data["notation"],
+            scopeNote=data["scopeNote"],
+            prefLabels=data["prefLabels"],
         )
 
+    @classmethod
+    def from_xml_element(cls, element) -> "ConceptScheme":
+        """
+        Return a ConceptScheme instance from an XML element.
+
+        Args:
+            element (ElementBase): The XML element to parse.
+
+        Returns:
+            ConceptScheme: The parsed ConceptScheme instance.
+        """
+        return cls.from_parsed_dict(cls.parse_xml_element(element))
+
     def to_dict(self, lang: str = "en") -> dict:
         """
         Return the ConceptScheme instance as a dictionary.
@@ -177,10 +286,10 @@ class Member(Base):
     Attributes:
         iri (str): The Internationalized Resource Identifier of the collection member.
         notation (str): The notation of the collection member.
-        prefLabels (dict[str, str]): The preferred labels of the collection member. This
-            is a dictionary where the key is the language code and the value is the
-            label in that language. To get the preferred label in a specific language,
-            use the `get_in_language` method.
+        prefLabels (dict[str, str | None]): The preferred labels of the collection
+            member. This is a dictionary where the key is the language code and the
+            value is the label in that language. To get the preferred label in a
+            specific language, use the `get_in_language` method.
         member_type (MemberType): The type of the collection member.
         concept_schemes (list[ConceptScheme]): The concept schemes to which the member
             belongs.
@@ -191,7 +300,7 @@ class Member(Base):
 
     iri: Mapped[str] = mapped_column(primary_key=True)
     notation: Mapped[str] = mapped_column()
-    prefLabels: Mapped[dict[str, str]] = mapped_column()
+    prefLabels: Mapped[dict[str, str | None]] = mapped_column()
     member_type: Mapped[MemberType] = mapped_column()
 
     __mapper_args__ = {
@@ -213,25 +322,24 @@ class Member(Base):
     @classmethod
     def get_concept_schemes(
         cls,
-        element,
-        concept_schemes: list[ConceptScheme],
+        scheme_iris: list[str],
+        concept_schemes_by_iri: dict[str, ConceptScheme],
     ) -> list[ConceptScheme]:
         """
         Get the concept schemes to which the member belongs.
 
         Args:
-            element (ElementBase): The XML element to parse.
-            concept_schemes (list[ConceptScheme]): The concept schemes to which the
-                member belongs.
+            scheme_iris (list[str]): The IRIs of the concept schemes of the member.
+            concept_schemes_by_iri (dict[str, ConceptScheme]): The available concept
+                schemes, indexed by IRI.
 
         Returns:
             list[ConceptScheme]: The concept schemes to which the member belongs.
         """
-        scheme_iris = get_sub_element_attributes(element, "core:inScheme", "resource")
         return [
-            concept_scheme
-            for concept_scheme in concept_schemes
-            if concept_scheme.iri in scheme_iris
+            concept_schemes_by_iri[scheme_iri]
+            for scheme_iri in dict.fromkeys(scheme_iris)
+            if scheme_iri in concept_schemes_by_iri
         ]
 
     def to_dict(self, lang: str = "en") -> dict:
@@ -263,12 +371,15 @@ class Collection(Member):
 
     Attributes:
         iri (str): The Internationalized Resource Identifier of the collection.
+        member_iris (tuple[str, ...]): The IRIs of the collection members, as parsed
+            from the XML element. Not persisted, and cleared once the members are
+            resolved.
     """
 
     __tablename__ = "collections"
 
     iri: Mapped[str] = mapped_column(ForeignKey(Member.iri), primary_key=True)
-    member_iris: list[str] = []
+    member_iris: tuple[str, ...] = ()
 
     members: Mapped[list[Member]] = relationship(
         "Member",
@@ -280,40 +391,115 @@ class Collection(Member):
         "polymorphic_identity": MemberType.COLLECTION,
     }
 
+    @classmethod
+    def parse_xml_element(cls, element) -> dict:
+        """
+        Collect the data of a Collection from an XML element.
+
+        Args:
+            element (ElementBase): The XML element to parse.
+
+        Returns:
+            dict: The parsed data, to be passed to `from_parsed_dict`.
+        """
+        children = scan_children(element, COLLECTION_CHILD_TAGS)
+        return {
+            "iri": get_element_iri(element),
+            "notation": get_sub_element_as_str(children, NOTATION_TAG),
+            "prefLabels": get_sub_elements_as_dict(children, PREF_LABEL_TAG),
+            "scheme_iris": get_sub_element_attributes(
+                children, IN_SCHEME_TAG, RDF_RESOURCE
+            ),
+            "member_iris": get_sub_element_attributes(
+                children, MEMBER_TAG, RDF_RESOURCE
+            ),
+        }
+
+    @classmethod
+    def from_parsed_dict(
+        cls,
+        data: dict,
+        concept_schemes_by_iri: dict[str, ConceptScheme],
+    ) -> "Collection":
+        """
+        Return a Collection instance from the data collected by `parse_xml_element`.
+
+        Args:
+            data (dict): The parsed data.
+            concept_schemes_by_iri (dict[str, ConceptScheme]): The available concept
+                schemes, indexed by IRI.
+
+        Returns:
+            Collection: The parsed Collection instance.
+        """
+        return Collection(
+            iri=data["iri"],
+            notation=data["notation"],
+            prefLabels=data["prefLabels"],
+            concept_schemes=cls.get_concept_schemes(
+                data["scheme_iris"], concept_schemes_by_iri
+            ),
+            member_iris=tuple(data["member_iris"]),
+        )
+
     @classmethod
     def from_xml_element(
         cls,
         element,
-        concept_schemes: list[ConceptScheme],
+        concept_schemes_by_iri: dict[str, ConceptScheme],
     ) -> "Collection":
         """
         Return a Collection instance from an XML element.
 
         Args:
             element (ElementBase): The XML element to parse.
+            concept_schemes_by_iri (dict[str, ConceptScheme]): The available concept
+                schemes, indexed by IRI.
 
         Returns:
             Collection: The parsed Collection instance.
         """
-        return Collection(
-            iri=get_element_attribute(element, "about"),
-            notation=get_sub_element_as_str(element, "core:notation"),
-            prefLabels=get_sub_elements_as_dict(element, "core:prefLabel"),
-            concept_schemes=cls.get_concept_schemes(element, concept_schemes),
-            member_iris=get_sub_element_attributes(element, "core:member", "resource"),
+        return cls.from_parsed_dict(
+            cls.parse_xml_element(element), concept_schemes_by_iri
         )
 
-    def resolve_members_from_xml(self, members: list[Member]) -> None:
+    def resolve_members_from_xml(self, members_by_iri: dict[str, Member]) -> None:
         """
-        Resolve the collections members from an xml element.
+        Resolve the collections members from an xml element, and release the parsed
+        member IRIs.
 
         Args:
-            members (list[Member]): The list of all available members.
+            members_by_iri (dict[str, Member]): All the available members, indexed by
+                IRI.
 
         Returns:
             None
         """
-        self.members = [member for member in members if member.iri in self.member_iris]
+        self.members = [
+            members_by_iri[member_iri]
+            for member_iri in dict.fromkeys(self.member_iris)
+            if member_iri in members_by_iri
+        ]
+        self.member_iris = ()
+
+    def iter_in_collection_rows(
+        self,
+        members_by_iri: dict[str, Member],
+    ) -> Iterator[dict]:
+        """
+        Yield the rows of the `in_collection` association table for the collection
+        members, skipping the members that are not available.
+
+        Args:
+            members_by_iri (dict[str, Member]): All the available members, indexed by
+                IRI.
+
+        Yields:
+            dict: The association rows.
+        """
+        for member_iri in dict.fromkeys(self.member_iris):
+            if member_iri in members_by_iri:
+                yield {"collection_iri": self.iri, "member_iri": member_iri}
 
 
 class Concept(Member):
@@ -339,7 +525,7 @@ class Concept(Member):
             a dictionary where the key is the language code and the value is a list of
             labels in that language. To get the alternative labels in a specific
             language, use the `get_in_language_list` method.
-        scopeNotes (dict[str, str]): The scope notes of the concept.
+        scopeNotes (dict[str, str | None]): The scope notes of the concept.
             This is a dictionary where the key is the language code and the value is the
             note in that language. To get the scope note in a specific language, use the
             `get_in_language` method.
@@ -350,37 +536,87 @@ class Concept(Member):
     iri: Mapped[str] = mapped_column(ForeignKey(Member.iri), primary_key=True)
     identifier: Mapped[str] = mapped_column()
     altLabels: Mapped[dict[str, list[str]]] = mapped_column()
-    scopeNotes: Mapped[dict[str, str]] = mapped_column()
+    scopeNotes: Mapped[dict[str, str | None]] = mapped_column()
 
     __mapper_args__ = {
         "polymorphic_identity": MemberType.CONCEPT,
     }
 
+    @classmethod
+    def parse_xml_element(cls, element) -> dict:
+        """
+        Collect the data of a Concept, and of its semantic relations, from an XML
+        element.
+
+        Args:
+            element (ElementBase): The XML element to parse.
+
+        Returns:
+            dict: The parsed data, to be passed to `from_parsed_dict` and to
+                `SemanticRelation.from_parsed_dict`.
+        """
+        children = scan_children(element, CONCEPT_CHILD_TAGS)
+        return {
+            "iri": get_element_iri(element),
+            "identifier": get_sub_element_as_str(children, IDENTIFIER_TAG),
+            "notation": get_sub_element_as_str(children, NOTATION_TAG),
+            "prefLabels": get_sub_elements_as_dict(children, PREF_LABEL_TAG),
+            "altLabels": get_sub_elements_as_dict_of_lists(children, ALT_LABEL_TAG),
+            "scopeNotes": get_sub_elements_as_dict(children, SCOPE_NOTE_TAG),
+            "scheme_iris": get_sub_element_attributes(
+                children, IN_SCHEME_TAG, RDF_RESOURCE
+            ),
+            "relations": SemanticRelation.parse_children(children),
+        }
+
+    @classmethod
+    def from_parsed_dict(
+        cls,
+        data: dict,
+        concept_schemes_by_iri: dict[str, ConceptScheme],
+    ) -> "Concept":
+        """
+        Return a Concept instance from the data collected by `parse_xml_element`.
+
+        Args:
+            data (dict): The parsed data.
+            concept_schemes_by_iri (dict[str, ConceptScheme]): The available concept
+                schemes, indexed by IRI.
+
+        Returns:
+            Concept: The parsed Concept instance.
+        """
+        return Concept(
+            iri=data["iri"],
+            identifier=data["identifier"],
+            notation=data["notation"],
+            prefLabels=data["prefLabels"],
+            altLabels=data["altLabels"],
+            scopeNotes=data["scopeNotes"],
+            concept_schemes=cls.get_concept_schemes(
+                data["scheme_iris"], concept_schemes_by_iri
+            ),
+        )
+
     @classmethod
     def from_xml_element(
         cls,
         element,
-        concept_schemes: list[ConceptScheme],
+        concept_schemes_by_iri: dict[str, ConceptScheme],
     ) -> "Concept":
         """
         Return a Concept instance from an XML element.
 
         Args:
             element (ElementBase): The XML element to parse.
-            concept_schemes (ConceptScheme): The concept schemes to which the concept
-                belongs.
+            concept_schemes_by_iri (dict[str, ConceptScheme]): The available concept
+                schemes, indexed by IRI.
 
         Returns:
             Concept: The parsed Concept instance.
         """
-        return Concept(
-            iri=get_element_attribute(element, "about"),
-            identifier=get_sub_element_as_str(element, "x_1.1:identifier"),
-            notation=get_sub_element_as_str(element, "core:notation"),
-            prefLabels=get_sub_elements_as_dict(element, "core:prefLabel"),
-            altLabels=get_sub_elements_as_dict_of_lists(element, "core:altLabel"),
-            scopeNotes=get_sub_elements_as_dict(element, "core:scopeNote"),
-            concept_schemes=cls.get_concept_schemes(element, concept_schemes),
+        return cls.from_parsed_dict(
+            cls.parse_xml_element(element), concept_schemes_by_iri
         )
 
     def to_dict(self, lang: str = "en") -> dict:
@@ -468,10 +704,86 @@ class SemanticRelation(Base):
     target_concept_iri: Mapped[str] = mapped_column(
         ForeignKey(Concept.iri),
         primary_key=True,
+        index=True,
     )
     source_concept: Mapped["Concept"] = relationship(foreign_keys=[source_concept_iri])
     target_concept: Mapped["Concept"] = relationship(foreign_keys=[target_concept_iri])
 
+    @classmethod
+    def parse_xml_element(cls, element) -> dict[SemanticRelationType, list[str]]:
+        """
+        Collect the target concept IRIs of the semantic relations of a concept, by
+        relation type, from an XML element.
+
+        Args:
+            element (ElementBase): The XML element to parse.
+
+        Returns:
+            dict[SemanticRelationType, list[str]]: The target concept IRIs.
+        """
+        return cls.parse_children(scan_children(element, SEMANTIC_RELATION_CHILD_TAGS))
+
+    @classmethod
+    def parse_children(
+        cls,
+        children: dict[str, list],
+    ) -> dict[SemanticRelationType, list[str]]:
+        """
+        Collect the target concept IRIs of the semantic relations of a concept, by
+        relation type, from the already scanned sub elements of the concept. Only
+        the relation types present on the concept are included.
+
+        Args:
+            children (dict[str, list]): The sub elements, as returned by
+                `scan_children`.
+
+        Returns:
+            dict[SemanticRelationType, list[str]]: The target concept IRIs.
+        """
+        return {
+            RELATION_TYPES_BY_TAG[tag]: get_sub_element_attributes(
+                children, tag, RDF_RESOURCE
+            )
+            for tag in children
+            if tag in RELATION_TYPES_BY_TAG
+        }
+
+    @classmethod
+    def iter_relation_rows(cls, data: dict) -> Iterator[dict]:
+        """
+        Yield the rows of the semantic relations of a concept, from the concept data
+        collected by `Concept.parse_xml_element`, to be used in bulk inserts without
+        instantiating the mapped objects.
+
+        Args:
+            data (dict): The parsed concept data.
+
+        Yields:
+            dict: The semantic relation rows.
+        """
+        source_concept_iri = data["iri"]
+        for relation_type, target_concept_iris in data["relations"].items():
+            for target_concept_iri in target_concept_iris:
+                yield {
+                    "type": relation_type,
+                    "source_concept_iri": source_concept_iri,
+                    "target_concept_iri": target_concept_iri,
+                }
+
+    @classmethod
+    def from_parsed_dict(cls, data: dict) -> list["SemanticRelation"]:
+        """
+        Return a list of SemanticRelation instances from the concept data collected
+        by `Concept.parse_xml_element`.
+
+        Args:
+            data (dict): The parsed concept data.
+
+        Returns:
+            list[SemanticRelation]: The parsed list of SemanticRelation instances.
+        """
+        return [SemanticRelation(**row) for row in cls.iter_relation_rows(data)]
+
     @classmethod
     def from_xml_element(cls, element) -> list["SemanticRelation"]:
         """
@@ -483,20 +795,12 @@ class SemanticRelation(Base):
         Returns:
             list[SemanticRelation]: The parsed list of SemanticRelation instances.
         """
-        relations: dict[SemanticRelationType, list[str]] = {}
-        for relation_type in SemanticRelationType:
-            relations[relation_type] = get_sub_element_attributes(
-                element, f"core:{relation_type.value}", "resource"
-            )
-        return [
-            SemanticRelation(
-                type=relation_type,
-                source_concept_iri=get_element_attribute(element, "about"),
-                target_concept_iri=target_concept_iri,
-            )
-            for relation_type, target_concept_iris in relations.items()
-            for target_concept_iri in target_concept_iris
-        ]
+        return cls.from_parsed_dict(
+            {
+                "iri": get_element_iri(element),
+                "relations": cls.parse_xml_element(element),
+            }
+        )
 
     def to_dict(self) -> dict:
         """
@@ -512,11 +816,109 @@ class SemanticRelation(Base):
         }
 
 
+class ConceptSchemesView(Base):
+    """
+    Precomputed payload of the concept schemes list in a given language. The rows are
+    written by `init_datasets` so that the concept schemes can be served without
+    building the response item by item.
+
+    Attributes:
+        lang (str): The language code of the payload.
+        payload (list[dict]): The concept schemes as dictionaries, as returned by
+            `ConceptScheme.to_dict` for `lang`.
+    """
+
+    __tablename__ = "concept_schemes_view"
+
+    lang: Mapped[str] = mapped_column(primary_key=True)
+    payload: Mapped[list[dict]] = mapped_column()
+
+    def to_dict(self) -> dict:
+        """
+        Return the ConceptSchemesView instance as a dictionary.
+
+        Returns:
+            dict: The ConceptSchemesView instance as a dictionary.
+        """
+        return {
+            "lang": self.lang,
+            "payload": self.payload,
+        }
+
+
+class ConceptsView(Base):
+    """
+    Precomputed payload of the concepts of a concept scheme in a given language. The
+    rows are written by `init_datasets` so that the concepts can be served without
+    building the response item by item.
+
+    Attributes:
+        concept_scheme_iri (str): The IRI of the concept scheme.
+        lang (str): The language code of the payload.
+        payload (list[dict]): The concepts as dictionaries, as returned by
+            `Concept.to_dict` for `lang`.
+    """
+
+    __tablename__ = "concepts_view"
+
+    concept_scheme_iri: Mapped[str] = mapped_column(
+        ForeignKey(ConceptScheme.iri),
+        primary_key=True,
+    )
+    lang: Mapped[str] = mapped_column(primary_key=True)
+    payload: Mapped[list[dict]] = mapped_column()
+
+    def to_dict(self) -> dict:
+        """
+        Return the ConceptsView instance as a dictionary.
+
+        Returns:
+            dict: The ConceptsView instance as a dictionary.
+        """
+        return {
+            "concept_scheme_iri": self.concept_scheme_iri,
+            "lang": self.lang,
+            "payload": self.payload,
+        }
+
+
+class DatasetsGeneration(Base):
+    """
+    Generation stamp of the saved datasets, renewed whenever the views are saved. The
+    table holds a single row, which every worker checks to know if its cached
+    responses are still current.
+
+    Attributes:
+        generation (str): The generation stamp.
+    """
+
+    __tablename__ = "datasets_generation"
+
+    generation: Mapped[str] = mapped_column(primary_key=True)
+
+    def to_dict(self) -> dict:
+        """
+        Return the DatasetsGeneration instance as a dictionary.
+
+        Returns:
+            dict: The DatasetsGeneration instance as a dictionary.
+        """
+        return {
+            "generation": self.generation,
+        }
+
+
 in_scheme = Table(
     "in_scheme",
     Base.metadata,
     Column("scheme_iri", String, ForeignKey(ConceptScheme.iri), primary_key=True),
-    Column("member_iri", String, ForeignKey(Member.iri), primary_key=True),
+    Column(
+        "member_iri",
+        String,
+        ForeignKey(Member.iri),
+        primary_key=True,
+        index=True,
+    ),
 )
 
 
@@ -524,5 +926,11 @@ in_collection = Table(
     "in_collection",
     Base.metadata,
     Column("collection_iri", String, ForeignKey(Collection.iri), primary_key=True),
-    Column("member_iri", String, ForeignKey(Member.iri), primary_key=True),
+    Column(
+        "member_iri",
+        String,
+        ForeignKey(Member.iri),
+        primary_key=True,
+        index=True,
+    ),
 )
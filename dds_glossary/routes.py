@@ -1,11 +1,17 @@
 """Routes for the dds_glossary server."""
 
+from http import HTTPStatus
+from typing import Final, Sequence
+
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 from fastapi_versioning import version
+from pydantic import BaseModel
+from pydantic_core import to_json
 from starlette.templating import Jinja2Templates, _TemplateResponse
 
 from .auth import get_api_key
+from .database import get_payload_etag, get_payload_gzip
 from .schema import (
     CollectionResponse,
     ConceptResponse,
@@ -18,10 +24,83 @@ from .schema import (
 )
 from .services import GlossaryController, get_controller, get_templates
 
-router_versioned = APIRouter()
+GZIP_COMPRESS_LEVEL: Final[int] = 5
+GZIP_MINIMUM_SIZE: Final[int] = 1024
+
+router_versioned = APIRouter(default_response_class=ORJSONResponse)
 router_non_versioned = APIRouter()
 
 
+def json_response(content: BaseModel | Sequence[BaseModel]) -> Response:
+    """Encode the response models with the compiled pydantic-core serializer, which
+    walks the model fields directly, bypassing `jsonable_encoder`.
+
+    Args:
+        content (BaseModel | Sequence[BaseModel]): The response models.
+
+    Returns:
+        Response: The JSON response.
+    """
+    return Response(
+        content=to_json(content),
+        media_type="application/json",
+    )
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Check if the client accepts gzip encoded responses, from the codings and
+    q-values of its `Accept-Encoding` header. An explicit `gzip` coding takes
+    precedence over `*`.
+
+    Args:
+        request (Request): The request.
+
+    Returns:
+        bool: True if gzip is accepted with a non-zero q-value, else False.
+    """
+    qvalues: dict[str, float] = {}
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, *params = coding.split(";")
+        qvalue = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[name.strip().lower()] = qvalue
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+
+def payload_response(request: Request, payload: str) -> Response:
+    """Return a precomputed payload with its entity tag, or an empty 304 response
+    if the client already has it. The payload is sent already compressed to the
+    clients accepting gzip once it reaches `GZIP_MINIMUM_SIZE`. Otherwise it is
+    marked with the `identity` coding, so that the gzip middleware leaves it as is.
+
+    Args:
+        request (Request): The request.
+        payload (str): The JSON payload.
+
+    Returns:
+        Response: The JSON response, or the 304 response.
+    """
+    etag = get_payload_etag(payload)
+    headers = {"ETag": etag}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+    headers["Vary"] = "Accept-Encoding"
+    content = payload.encode()
+    if len(content) >= GZIP_MINIMUM_SIZE and accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        content = get_payload_gzip(payload, GZIP_COMPRESS_LEVEL)
+    else:
+        headers["Content-Encoding"] = "identity"
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 @router_non_versioned.get("/")
 def home(
     request: Request,
@@ -65,18 +144,22 @@ def home(
 
 @router_versioned.get("/status")
 @version(0, 1)
-def status() -> RedirectResponse:
+async def status() -> RedirectResponse:
     """Redirect to the status page."""
     return RedirectResponse(url="https://sentier.instatus.com/")
 
 
-@router_versioned.get("/search")
+@router_versioned.get(
+    "/search",
+    response_model=None,
+    responses={HTTPStatus.OK.value: {"model": list[ConceptResponse]}},
+)
 @version(0, 1)
 def search(
     search_term: str,
     controller: GlossaryController = Depends(get_controller),
     lang: str = "en",
-) -> list[ConceptResponse]:
+) -> Response:
     """Search concepts according to given expression.
     Note: This will be removed once #35 (Add elasticsearch) is closed.
 
@@ -86,14 +169,14 @@ def search(
         lang (str): The language to use for searching concepts. Defaults to "en".
 
     Returns:
-        list[ConceptResponse]: The search results, if any.
+        Response: The search results, if any, as a list of `ConceptResponse`.
     """
-    return controller.search_database(search_term, lang=lang)
+    return json_response(controller.search_database(search_term, lang=lang))
 
 
 @router_versioned.get("/version")
 @version(0, 1)
-def get_version() -> VersionResponse:
+async def get_version() -> VersionResponse:
     """Get the version of the server.
 
     Returns:
@@ -122,32 +205,46 @@ def init_datasets(
     return controller.init_datasets(reload=reload)
 
 
-@router_versioned.get("/schemes")
+@router_versioned.get(
+    "/schemes",
+    response_model=None,
+    responses={HTTPStatus.OK.value: {"model": list[ConceptSchemeResponse]}},
+)
 @version(0, 1)
 def get_concept_schemes(
+    request: Request,
     controller: GlossaryController = Depends(get_controller),
     lang: str = "en",
-) -> list[ConceptSchemeResponse]:
+) -> Response:
     """
-    Returns all the saved concept schemes.
+    Returns all the saved concept schemes. The precomputed payload is returned as is
+    if available, with its entity tag.
 
     Args:
+        request (Request): The request.
         controller (GlossaryController): The glossary controller.
         lang (str): The language. Defaults to "en".
 
     Returns:
-        list[ConceptSchemeResponse]: The concept schemes.
+        Response: The concept schemes, as a list of `ConceptSchemeResponse`.
     """
-    return controller.get_concept_schemes(lang=lang)
+    payload = controller.get_concept_schemes_payload(lang=lang)
+    if payload is not None:
+        return payload_response(request, payload)
+    return json_response(controller.get_concept_schemes(lang=lang))
 
 
-@router_versioned.get("/scheme")
+@router_versioned.get(
+    "/scheme",
+    response_model=None,
+    responses={HTTPStatus.OK.value: {"model": FullConceptSchemeResponse}},
+)
 @version(0, 1)
 def get_concept_scheme(
     concept_scheme_iri: str,
     controller: GlossaryController = Depends(get_controller),
     lang: str = "en",
-) -> FullConceptSchemeResponse:
+) -> Response:
     """
     Returns a concept scheme.
 
@@ -157,19 +254,23 @@ def get_concept_scheme(
         lang (str): The language. Defaults to "en".
 
     Returns:
-        FullConceptSchemeResponse: The concept scheme with member
-            concepts and collections.
+        Response: The concept scheme with member concepts and collections, as a
+            `FullConceptSchemeResponse`.
     """
-    return controller.get_concept_scheme(concept_scheme_iri, lang=lang)
+    return json_response(controller.get_concept_scheme(concept_scheme_iri, lang=lang))
 
 
-@router_versioned.get("/collections")
+@router_versioned.get(
+    "/collections",
+    response_model=None,
+    responses={HTTPStatus.OK.value: {"model": list[EntityResponse]}},
+)
 @version(0, 1)
 def get_collections(
     concept_scheme_iri: str,
     controller: GlossaryController = Depends(get_controller),
     lang: str = "en",
-) -> list[EntityResponse]:
+) -> Response:
     """
     Returns all the collections.
 
@@ -179,18 +280,22 @@ def get_collections(
         lang (str): The language. Defaults to "en".
 
     Returns:
-        list[CollectionResponse]: The collections.
+        Response: The collections, as a list of `EntityResponse`.
     """
-    return controller.get_collections(concept_scheme_iri, lang=lang)
+    return json_response(controller.get_collections(concept_scheme_iri, lang=lang))
 
 
-@router_versioned.get("/collection")
+@router_versioned.get(
+    "/collection",
+    response_model=None,
+    responses={HTTPStatus.OK.value: {"model": CollectionResponse}},
+)
 @version(0, 1)
 def get_collection(
     collection_iri: str,
     controller: GlossaryController = Depends(get_controller),
     lang: str = "en",
-) -> CollectionResponse:
+) -> Response:
     """
     Returns a collection.
 
@@ -200,40 +305,54 @@ def get_collection(
         lang (str): The language. Defaults to "en".
 
     Returns:
-        CollectionResponse: The collection with member collections
-            and concepts.
+        Response: The collection with member collections and concepts, as a
+            `CollectionResponse`.
     """
-    return controller.get_collection(collection_iri, lang=lang)
+    return json_response(controller.get_collection(collection_iri, lang=lang))
 
 
-@router_versioned.get("/concepts")
+@router_versioned.get(
+    "/concepts",
+    response_model=None,
+    responses={HTTPStatus.OK.value: {"model": list[ConceptResponse]}},
+)
 @version(0, 1)
 def get_concepts(
+    request: Request,
     concept_scheme_iri: str,
     controller: GlossaryController = Depends(get_controller),
     lang: str = "en",
-) -> list[ConceptResponse]:
+) -> Response:
     """
-    Returns all the concepts in a concept scheme.
+    Returns all the concepts in a concept scheme. The precomputed payload is returned
+    as is if available, with its entity tag.
 
     Args:
+        request (Request): The request.
         concept_scheme_iri (str): The concept scheme IRI.
         controller (GlossaryController): The glossary controller.
         lang (str): The language. Defaults to "en".
 
     Returns:
-        list[ConceptResponse]: The concepts.
+        Response: The concepts, as a list of `ConceptResponse`.
     """
-    return controller.get_concepts(concept_scheme_iri, lang=lang)
+    payload = controller.get_concepts_payload(concept_scheme_iri, lang=lang)
+    if payload is not None:
+        return payload_response(request, payload)
+    return json_response(controller.get_concepts(concept_scheme_iri, lang=lang))
 
 
-@router_versioned.get("/concept")
+@router_versioned.get(
+    "/concept",
+    response_model=None,
+    responses={HTTPStatus.OK.value: {"model": FullConceptResponse}},
+)
 @version(0, 1)
 def get_concept(
     concept_iri: str,
     controller: GlossaryController = Depends(get_controller),
     lang: str = "en",
-) -> FullConceptResponse:
+) -> Response:
     """
     Returns a concept.
 
@@ -242,6 +361,7 @@ def get_concept(
         lang (str): The language. Defaults to "en".
 
     Returns:
-        FullConceptResponse: The concept with concept scheme and relations.
+        Response: The concept with concept scheme and relations, as a
+            `FullConceptResponse`.
     """
-    return controller.get_concept(concept_iri, lang=lang)
+    return json_response(controller.get_concept(concept_iri, lang=lang))
@@ -38,12 +38,12 @@ class EntityResponse(BaseModel):
         iri (str): The IRI of the concept scheme.
         notation (str): The notation of the concept scheme.
         scopeNote (str): The scope note of the concept scheme.
-        prefLabel (str): The preferred label of the concept scheme.
+        prefLabel (str | None): The preferred label of the concept scheme.
     """
 
     iri: str
     notation: str
-    prefLabel: str
+    prefLabel: str | None
 
 
 class ConceptSchemeResponse(EntityResponse):
@@ -78,12 +78,12 @@ class ConceptResponse(EntityResponse):
 
     Attributes:
         identifier (str): The identifier of the concept.
-        scopeNote (str): The scope note of the concept.
+        scopeNote (str | None): The scope note of the concept.
         altLabels (list[str[]): The alternative labels of the concept.
     """
 
     identifier: str
-    scopeNote: str
+    scopeNote: str | None
     altLabels: list[str]
 
 
@@ -1,23 +1,39 @@
 """Services classes and utils for the dds_glossary package."""
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import get_context
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Final
 
 from appdirs import user_data_dir
-from defusedxml.lxml import parse as parse_xml
+from fastapi import Request
 from fastapi.templating import Jinja2Templates
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
 from owlready2 import get_ontology, onto_path
 from sqlalchemy import Engine
 from sqlalchemy.exc import NoResultFound
 
 from .database import (
+    PAYLOAD_CACHE_SIZE,
     get_collection,
     get_concept,
     get_concept_scheme,
     get_concept_schemes,
+    get_concept_schemes_payload,
+    get_concepts_payload,
+    get_datasets_generation,
     get_relations,
     init_engine,
     save_dataset,
+    save_views,
     search_database,
 )
 from .enums import MemberType
@@ -45,6 +61,73 @@ from .schema import (
     InitDatasetsResponse,
     RelationResponse,
 )
+from .settings import get_settings
+from .xml import SKOS_NAMESPACE, iterparse_elements
+
+CONCEPT_SCHEME_TAG: Final[str] = f"{SKOS_NAMESPACE}ConceptScheme"
+COLLECTION_TAG: Final[str] = f"{SKOS_NAMESPACE}Collection"
+CONCEPT_TAG: Final[str] = f"{SKOS_NAMESPACE}Concept"
+DATASET_WORKERS: Final[int] = 2
+
+
+def parse_dataset_elements(
+    dataset_path: Path,
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Collect the data of the concept schemes, concepts, and collections of a dataset.
+    The document is streamed, so that only one element is kept in memory at a time.
+    Only plain data is returned, so that datasets can be parsed in worker processes.
+
+    Args:
+        dataset_path (Path): The dataset path.
+
+    Returns:
+        tuple[list[dict], list[dict], list[dict]]: The parsed concept schemes,
+            concepts, and collections.
+    """
+    concept_scheme_dicts: list[dict] = []
+    concept_dicts: list[dict] = []
+    collection_dicts: list[dict] = []
+    for element in iterparse_elements(
+        dataset_path,
+        (CONCEPT_SCHEME_TAG, COLLECTION_TAG, CONCEPT_TAG),
+    ):
+        if element.tag == CONCEPT_TAG:
+            concept_dicts.append(Concept.parse_xml_element(element))
+        elif element.tag == COLLECTION_TAG:
+            collection_dicts.append(Collection.parse_xml_element(element))
+        else:
+            concept_scheme_dicts.append(ConceptScheme.parse_xml_element(element))
+    return concept_scheme_dicts, concept_dicts, collection_dicts
+
+
+def load_dataset_elements(
+    dataset: Dataset,
+    dataset_path: Path,
+    reload: bool = False,
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Download and save the dataset, if it does not exist or if the reload flag is set,
+    then collect its data with `parse_dataset_elements`. Meant to run in a worker
+    process, each with its own owlready2 world, so that datasets are downloaded
+    concurrently.
+
+    Args:
+        dataset (Dataset): The dataset.
+        dataset_path (Path): The dataset path.
+        reload (bool): Flag to reload the dataset. Defaults to False.
+
+    Returns:
+        tuple[list[dict], list[dict], list[dict]]: The parsed concept schemes,
+            concepts, and collections.
+    """
+    if reload or not dataset_path.exists():
+        data_dir = str(dataset_path.parent)
+        if data_dir not in onto_path:
+            onto_path.append(data_dir)
+        ontology = get_ontology(dataset.url).load(reload=reload)
+        ontology.save(file=str(dataset_path), format="rdfxml")
+    return parse_dataset_elements(dataset_path)
 
 
 class GlossaryController:
@@ -101,6 +184,8 @@ class GlossaryController:
         self.data_dir = Path(data_dir_path)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         onto_path.append(str(self.data_dir))
+        self._get_concept = lru_cache(maxsize=PAYLOAD_CACHE_SIZE)(self._load_concept)
+        self._concepts_generation: str | None = None
 
     @staticmethod
     def get_scheme_members(
@@ -118,48 +203,121 @@ class GlossaryController:
         """
         return [member for member in members if member.member_type == member_type]
 
-    def parse_dataset(
-        self,
-        dataset_path: Path,
+    @staticmethod
+    def split_scheme_members(
+        members: list[Member],
+    ) -> tuple[list[Member], list[Member]]:
+        """
+        Split the members for a concept scheme into collections and concepts, in a
+        single pass.
+
+        Args:
+            members (list[Member]): The members.
+
+        Returns:
+            tuple[list[Member], list[Member]]: The collections and the concepts.
+        """
+        collections: list[Member] = []
+        concepts: list[Member] = []
+        for member in members:
+            if member.member_type == MemberType.COLLECTION:
+                collections.append(member)
+            elif member.member_type == MemberType.CONCEPT:
+                concepts.append(member)
+        return collections, concepts
+
+    @staticmethod
+    def build_dataset(
+        concept_scheme_dicts: list[dict],
+        concept_dicts: list[dict],
+        collection_dicts: list[dict],
     ) -> tuple[
         list[ConceptScheme],
         list[Concept],
         list[Collection],
-        list[SemanticRelation],
+        list[dict],
     ]:
         """
-        Parse a dataset.
+        Build a dataset from the data collected by `parse_dataset_elements`.
 
         Args:
-            dataset_path (Path): The dataset path.
+            concept_scheme_dicts (list[dict]): The parsed concept schemes.
+            concept_dicts (list[dict]): The parsed concepts.
+            collection_dicts (list[dict]): The parsed collections.
 
         Returns:
-            tuple[list[ConceptScheme], list[Concept], list[Collection],
-                list[SemanticRelation]]: The concept schemes, concepts, collections,
-                and semantic relations.
-        """
-        root = parse_xml(dataset_path).getroot()
-        concept_scheme_elements = root.findall("core:ConceptScheme", root.nsmap)
-        collection_elements = root.findall("core:Collection", root.nsmap)
-        concept_elements = root.findall("core:Concept", root.nsmap)
+            tuple[list[ConceptScheme], list[Concept], list[Collection], list[dict]]:
+                The concept schemes, concepts, collections, and semantic relation
+                rows.
+        """
         concept_schemes = [
-            ConceptScheme.from_xml_element(concept_scheme_element)
-            for concept_scheme_element in concept_scheme_elements
+            ConceptScheme.from_parsed_dict(concept_scheme_dict)
+            for concept_scheme_dict in concept_scheme_dicts
         ]
+        concept_schemes_by_iri = {
+            concept_scheme.iri: concept_scheme for concept_scheme in concept_schemes
+        }
         concepts = [
-            Concept.from_xml_element(concept_element, concept_schemes)
-            for concept_element in concept_elements
+            Concept.from_parsed_dict(concept_dict, concept_schemes_by_iri)
+            for concept_dict in concept_dicts
         ]
         collections = [
-            Collection.from_xml_element(collection_element, concept_schemes)
-            for collection_element in collection_elements
+            Collection.from_parsed_dict(collection_dict, concept_schemes_by_iri)
+            for collection_dict in collection_dicts
         ]
-        semantic_relations: list[SemanticRelation] = []
-        for concept_element in concept_elements:
-            semantic_relations.extend(
-                SemanticRelation.from_xml_element(concept_element)
-            )
-        return concept_schemes, concepts, collections, semantic_relations
+        semantic_relation_rows = [
+            row
+            for concept_dict in concept_dicts
+            for row in SemanticRelation.iter_relation_rows(concept_dict)
+        ]
+        return concept_schemes, concepts, collections, semantic_relation_rows
+
+    def parse_dataset(
+        self,
+        dataset_path: Path,
+    ) -> tuple[
+        list[ConceptScheme],
+        list[Concept],
+        list[Collection],
+        list[dict],
+    ]:
+        """
+        Parse a dataset. The document is streamed, so that only one element is kept
+        in memory at a time.
+
+        Args:
+            dataset_path (Path): The dataset path.
+
+        Returns:
+            tuple[list[ConceptScheme], list[Concept], list[Collection], list[dict]]:
+                The concept schemes, concepts, collections, and semantic relation
+                rows.
+        """
+        return self.build_dataset(*parse_dataset_elements(dataset_path))
+
+    def _submit_dataset(
+        self,
+        executor: ProcessPoolExecutor,
+        dataset: Dataset,
+        reload: bool,
+    ) -> Future:
+        """
+        Submit the download and parsing of a dataset to a worker process.
+
+        Args:
+            executor (ProcessPoolExecutor): The worker processes.
+            dataset (Dataset): The dataset.
+            reload (bool): Flag to reload the dataset.
+
+        Returns:
+            Future: The parsed concept schemes, concepts, and collections.
+        """
+        return executor.submit(
+            load_dataset_elements,
+            dataset,
+            self.data_dir / dataset.name,
+            reload,
+        )
 
     def init_datasets(
         self,
@@ -167,7 +325,11 @@ class GlossaryController:
     ) -> InitDatasetsResponse:
         """
         Download and save the datasets, if they do not exist or if the reload flag is
-        set.
+        set. Datasets already saved in the data directory are not downloaded again
+        unless the reload flag is set. The datasets are downloaded and parsed
+        concurrently in `DATASET_WORKERS` worker processes, and saved in order once
+        parsed. A dataset is only submitted once an earlier one is being saved, so
+        that at most `DATASET_WORKERS + 1` parsed datasets are held in memory.
 
         Args:
             reload (bool): Flag to reload the datasets. Defaults to False.
@@ -177,27 +339,40 @@ class GlossaryController:
         """
         saved_datasets: list[Dataset] = []
         failed_datasets: list[FailedDataset] = []
+        self.engine.dispose()
         self.engine = init_engine(drop_database_flag=True)
-        for dataset in self.datasets:
-            dataset_path = self.data_dir / dataset.name
-            try:
-                ontology = get_ontology(dataset.url).load(reload=reload)
-                ontology.save(file=str(dataset_path), format="rdfxml")
-                save_dataset(self.engine, *self.parse_dataset(dataset_path))
-                saved_datasets.append(
-                    Dataset(
-                        name=dataset.name,
-                        url=dataset.url,
+        with ProcessPoolExecutor(
+            max_workers=DATASET_WORKERS,
+            mp_context=get_context("spawn"),
+        ) as executor:
+            datasets = iter(self.datasets)
+            loaded_datasets: deque[tuple[Dataset, Future]] = deque(
+                (dataset, self._submit_dataset(executor, dataset, reload))
+                for dataset in islice(datasets, DATASET_WORKERS)
+            )
+            while loaded_datasets:
+                dataset, loaded_dataset = loaded_datasets.popleft()
+                for next_dataset in islice(datasets, 1):
+                    loaded_datasets.append(
+                        (
+                            next_dataset,
+                            self._submit_dataset(executor, next_dataset, reload),
+                        )
+                    )
+                try:
+                    save_dataset(
+                        self.engine, *self.build_dataset(*loaded_dataset.result())
                     )
-                )
-            except Exception as error:  # pylint: disable=broad-except
-                failed_datasets.append(
-                    FailedDataset(
-                        name=dataset.name,
-                        url=dataset.url,
-                        error=str(error),
+                    saved_datasets.append(dataset)
+                except Exception as error:  # pylint: disable=broad-except
+                    failed_datasets.append(
+                        FailedDataset(
+                            name=dataset.name,
+                            url=dataset.url,
+                            error=str(error),
+                        )
                     )
-                )
+        save_views(self.engine)
         return InitDatasetsResponse(
             saved_datasets=saved_datasets,
             failed_datasets=failed_datasets,
@@ -214,10 +389,23 @@ class GlossaryController:
             list[ConceptSchemeResponse]: The concept schemes.
         """
         return [
-            ConceptSchemeResponse(**concept_scheme.to_dict(lang=lang))
+            ConceptSchemeResponse.model_construct(**concept_scheme.to_dict(lang=lang))
             for concept_scheme in get_concept_schemes(self.engine)
         ]
 
+    def get_concept_schemes_payload(self, lang: str = "en") -> str | None:
+        """
+        Get the precomputed concept schemes, as a JSON string.
+
+        Args:
+            lang (str): The language. Defaults to "en".
+
+        Returns:
+            str | None: The concept schemes, or None if they have not been
+                precomputed.
+        """
+        return get_concept_schemes_payload(self.engine, lang=lang)
+
     def get_concept_scheme(
         self, concept_scheme_iri: str, lang: str = "en"
     ) -> FullConceptSchemeResponse:
@@ -240,18 +428,16 @@ class GlossaryController:
         except NoResultFound as nrf:
             raise ConceptSchemeNotFoundException(concept_scheme_iri) from nrf
 
-        collections = self.get_scheme_members(
-            concept_scheme.members, MemberType.COLLECTION
-        )
-        concepts = self.get_scheme_members(concept_scheme.members, MemberType.CONCEPT)
-        return FullConceptSchemeResponse(
+        collections, concepts = self.split_scheme_members(concept_scheme.members)
+        return FullConceptSchemeResponse.model_construct(
             **concept_scheme.to_dict(lang=lang),
             collections=[
-                EntityResponse(**collection.to_dict(lang=lang))
+                EntityResponse.model_construct(**collection.to_dict(lang=lang))
                 for collection in collections
             ],
             concepts=[
-                ConceptResponse(**concept.to_dict(lang=lang)) for concept in concepts
+                ConceptResponse.model_construct(**concept.to_dict(lang=lang))
+                for concept in concepts
             ],
         )
 
@@ -282,7 +468,7 @@ class GlossaryController:
             concept_scheme.members, MemberType.COLLECTION
         )
         return [
-            EntityResponse(**collection.to_dict(lang=lang))
+            EntityResponse.model_construct(**collection.to_dict(lang=lang))
             for collection in collections
         ]
 
@@ -308,16 +494,16 @@ class GlossaryController:
         except NoResultFound as nrf:
             raise CollectionNotFoundException(collection_iri) from nrf
 
-        collections = self.get_scheme_members(collection.members, MemberType.COLLECTION)
-        concepts = self.get_scheme_members(collection.members, MemberType.CONCEPT)
-        return CollectionResponse(
+        collections, concepts = self.split_scheme_members(collection.members)
+        return CollectionResponse.model_construct(
             **collection.to_dict(lang=lang),
             collections=[
-                EntityResponse(**collection.to_dict(lang=lang))
+                EntityResponse.model_construct(**collection.to_dict(lang=lang))
                 for collection in collections
             ],
             concepts=[
-                ConceptResponse(**concept.to_dict(lang=lang)) for concept in concepts
+                ConceptResponse.model_construct(**concept.to_dict(lang=lang))
+                for concept in concepts
             ],
         )
 
@@ -345,11 +531,33 @@ class GlossaryController:
             raise ConceptSchemeNotFoundException(concept_scheme_iri) from nrf
 
         concepts = self.get_scheme_members(concept_scheme.members, MemberType.CONCEPT)
-        return [ConceptResponse(**concept.to_dict(lang=lang)) for concept in concepts]
+        return [
+            ConceptResponse.model_construct(**concept.to_dict(lang=lang))
+            for concept in concepts
+        ]
+
+    def get_concepts_payload(
+        self,
+        concept_scheme_iri: str,
+        lang: str = "en",
+    ) -> str | None:
+        """
+        Get the precomputed concepts for a concept scheme, as a JSON string.
+
+        Args:
+            concept_scheme_iri (str): The concept scheme IRI.
+            lang (str): The language. Defaults to "en".
+
+        Returns:
+            str | None: The concepts, or None if they have not been precomputed.
+        """
+        return get_concepts_payload(self.engine, concept_scheme_iri, lang=lang)
 
     def get_concept(self, concept_iri: str, lang: str = "en") -> FullConceptResponse:
         """
-        Get the concept and al its relations.
+        Get the concept and al its relations. The responses are cached by the
+        controller until the datasets generation changes, which happens whenever the
+        datasets are initialized again by any worker.
 
         Args:
             concept_iri (str): The concept IRI.
@@ -358,6 +566,26 @@ class GlossaryController:
         Returns:
             FullConceptResponse: The concept with its concept schemes and relations.
 
+        Raises:
+            ConceptNotFoundException: If the concept is not found.
+        """
+        generation = get_datasets_generation(self.engine)
+        if generation != self._concepts_generation:
+            self._get_concept.cache_clear()
+            self._concepts_generation = generation
+        return self._get_concept(concept_iri, lang)
+
+    def _load_concept(self, concept_iri: str, lang: str) -> FullConceptResponse:
+        """
+        Load the concept and al its relations from the database.
+
+        Args:
+            concept_iri (str): The concept IRI.
+            lang (str): The language.
+
+        Returns:
+            FullConceptResponse: The concept with its concept schemes and relations.
+
         Raises:
             ConceptNotFoundException: If the concept is not found.
         """
@@ -366,11 +594,11 @@ class GlossaryController:
         except NoResultFound as nrf:
             raise ConceptNotFoundException(concept_iri) from nrf
 
-        return FullConceptResponse(
+        return FullConceptResponse.model_construct(
             **concept.to_dict(lang=lang),
             concept_schemes=[scheme.iri for scheme in concept.concept_schemes],
             relations=[
-                RelationResponse(**relation.to_dict())
+                RelationResponse.model_construct(**relation.to_dict())
                 for relation in get_relations(self.engine, concept_iri)
             ],
         )
@@ -390,26 +618,39 @@ class GlossaryController:
             list[ConceptResponse]: The result concepts matching the `search_term`.
         """
         return [
-            ConceptResponse(**concept.to_dict(lang=lang))
+            ConceptResponse.model_construct(**concept.to_dict(lang=lang))
             for concept in search_database(self.engine, search_term, lang=lang)
         ]
 
 
-def get_controller() -> GlossaryController:
+def get_controller(request: Request) -> GlossaryController:
     """
-    Get the glossary controller.
+    Get the glossary controller created by the application lifespan.
+
+    Args:
+        request (Request): The request.
 
     Returns:
         GlossaryController: The glossary controller.
     """
-    return GlossaryController()
+    return request.state.controller
 
 
+@lru_cache()
 def get_templates() -> Jinja2Templates:
     """
-    Get the Jinja2 templates.
+    Get the Jinja2 templates. The underlying environment is built once and shared
+    across requests, with compiled templates kept in a bytecode cache. Templates are
+    only checked for changes on disk when the `DEBUG` setting is enabled.
 
     Returns:
         Jinja2Templates: The Jinja2 templates.
     """
-    return Jinja2Templates(directory="templates")
+    env = Environment(
+        loader=FileSystemLoader("templates"),
+        autoescape=select_autoescape(),
+        auto_reload=get_settings().DEBUG,
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+    return Jinja2Templates(env=env)
@@ -11,9 +11,11 @@ class Settings(BaseSettings):
 
     API_KEY: SecretStr
     DATABASE_URL: SecretStr
+    DATABASE_NULL_POOL: bool = False
     SENTRY_DSN: SecretStr = SecretStr("")
 
     HOST_IP: str = "127.0.0.1"
+    DEBUG: bool = False
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
@@ -1,9 +1,49 @@
 """XML utilities for the dds_glossary package."""
 
 from collections import defaultdict
-from typing import Final
+from pathlib import Path
+from sys import intern
+from typing import Final, Iterator
+
+from lxml.etree import iterparse  # nosec B410 # pylint: disable=no-name-in-module
 
 XML_NAMESPACE: Final[str] = "{http://www.w3.org/XML/1998/namespace}"
+SKOS_NAMESPACE: Final[str] = "{http://www.w3.org/2004/02/skos/core#}"
+RDF_NAMESPACE: Final[str] = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+DC_NAMESPACE: Final[str] = "{http://purl.org/dc/elements/1.1/}"
+XML_LANG: Final[str] = f"{XML_NAMESPACE}lang"
+RDF_ABOUT: Final[str] = f"{RDF_NAMESPACE}about"
+RDF_RESOURCE: Final[str] = f"{RDF_NAMESPACE}resource"
+
+
+def iterparse_elements(source: str | Path, tags: tuple[str, ...]) -> Iterator:
+    """
+    Stream the elements with one of the given tags from an XML document. Each element
+    is yielded once it is fully parsed, and is freed, along with its already processed
+    siblings, once the caller is done with it. External entities are not resolved and
+    network access is disabled. The IDs are not indexed and the whitespace-only text
+    between elements is dropped, as neither is used.
+
+    Args:
+        source (str | Path): The path of the XML document.
+        tags (tuple[str, ...]): The tags to search for, in Clark notation.
+
+    Yields:
+        ElementBase: The parsed elements, in document order.
+    """
+    for _, element in iterparse(
+        str(source),
+        events=("end",),
+        tag=tags,
+        resolve_entities=False,
+        no_network=True,
+        collect_ids=False,
+        remove_blank_text=True,
+    ):
+        yield element
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
 
 
 def get_element_attribute(element, attribute: str, default_value: str = "") -> str:
@@ -12,88 +52,145 @@ def get_element_attribute(element, attribute: str, default_value: str = "") -> s
 
     Args:
         element (ElementBase): The XML element to parse.
-        attribute (str): The attribute to search for.
+        attribute (str): The attribute to search for, in Clark notation.
         default_value (str): The default value to return if the attribute does not
             exist.
 
     Returns:
         str: The attribute value if it exists, else the default value.
     """
-    attribute = element.get(f"{{{element.nsmap['rdf']}}}{attribute}")
+    attribute = element.get(attribute)
     return attribute if attribute is not None else default_value
 
 
+def get_element_iri(element) -> str:
+    """
+    Get the interned IRI of the XML element, from its `rdf:about` attribute. The IRI
+    is then shared with the references to the element, which are interned as well.
+
+    Args:
+        element (ElementBase): The XML element to parse.
+
+    Returns:
+        str: The IRI if it exists, else an empty string.
+    """
+    return intern(get_element_attribute(element, RDF_ABOUT))
+
+
+def scan_children(element, tags: tuple[str, ...]) -> dict[str, list]:
+    """
+    Collect the sub elements of the XML element with one of the given tags in a
+    single pass, grouped by tag in Clark notation, in document order. The filtering
+    is done by lxml, so the other sub elements, comments and processing instructions
+    are never handed to Python.
+
+    Args:
+        element (ElementBase): The XML element to parse.
+        tags (tuple[str, ...]): The tags to collect, in Clark notation.
+
+    Returns:
+        dict[str, list]: The sub elements, by tag.
+    """
+    children: dict[str, list] = defaultdict(list)
+    for child in element.iterchildren(tag=tags):
+        children[child.tag].append(child)
+    return children
+
+
+def get_element_language(element) -> str | None:
+    """
+    Get the interned language code of the XML element, if it exists.
+
+    Args:
+        element (ElementBase): The XML element to parse.
+
+    Returns:
+        str | None: The language code if it exists, else None.
+    """
+    lang = element.get(XML_LANG)
+    return intern(lang) if lang is not None else None
+
+
 def get_sub_element_attributes(
-    element,
+    children: dict[str, list],
     tag: str,
     attribute: str,
     default_value: str = "",
 ) -> list[str]:
     """
-    Get the attributes of the sub elements.
+    Get the attributes of the sub elements. The values are interned, as the same
+    resource IRIs are referenced by many elements.
 
     Args:
-        element (ElementBase): The XML element to parse.
-        tag (str): The tag to search for.
-        attribute (str): The attribute to get.
+        children (dict[str, list]): The sub elements, as returned by `scan_children`.
+        tag (str): The tag to search for, in Clark notation.
+        attribute (str): The attribute to get, in Clark notation.
 
     Returns:
         list: The attributes.
     """
     return [
-        get_element_attribute(sub_element, attribute, default_value)
-        for sub_element in element.findall(tag, namespaces=element.nsmap)
+        intern(get_element_attribute(sub_element, attribute, default_value))
+        for sub_element in children.get(tag, ())
     ]
 
 
-def get_sub_element_as_str(element, tag: str, default_value: str = "") -> str:
+def get_sub_element_as_str(
+    children: dict[str, list],
+    tag: str,
+    default_value: str = "",
+) -> str:
     """
-    Get a sub element text from the XML element if tag exists, else return
+    Get the text of the first sub element with the tag if it exists, else return
     default_value.
 
     Args:
-        element (ElementBase): The XML element to parse.
-        tag (str): The tag to search for.
+        children (dict[str, list]): The sub elements, as returned by `scan_children`.
+        tag (str): The tag to search for, in Clark notation.
         default_value (str): The default value to return if the tag does not exist.
 
     Returns:
         str: The sub element text if the tag exists, else the default value.
     """
-    sub_element = element.find(tag, namespaces=element.nsmap)
-    return sub_element.text if sub_element is not None else default_value
+    sub_elements = children.get(tag)
+    return sub_elements[0].text if sub_elements else default_value
 
 
-def get_sub_elements_as_dict(element, tag: str) -> dict[str, str]:
+def get_sub_elements_as_dict(
+    children: dict[str, list],
+    tag: str,
+) -> dict[str | None, str]:
     """
     Get the sub elements as a dictionary.
 
     Args:
-        element (ElementBase): The XML element to parse.
-        tag (str): The tag to search for.
+        children (dict[str, list]): The sub elements, as returned by `scan_children`.
+        tag (str): The tag to search for, in Clark notation.
 
     Returns:
         dict: The labels.
     """
     return {
-        sub_element.get(f"{XML_NAMESPACE}lang"): sub_element.text
-        for sub_element in element.findall(tag, namespaces=element.nsmap)
+        get_element_language(sub_element): sub_element.text
+        for sub_element in children.get(tag, ())
     }
 
 
-def get_sub_elements_as_dict_of_lists(element, tag: str) -> dict[str, list[str]]:
+def get_sub_elements_as_dict_of_lists(
+    children: dict[str, list],
+    tag: str,
+) -> dict[str | None, list[str]]:
     """
     Get the sub elements as a dictionary of lists.
 
     Args:
-        element (ElementBase): The XML element to parse.
-        tag (str): The tag to search for.
+        children (dict[str, list]): The sub elements, as returned by `scan_children`.
+        tag (str): The tag to search for, in Clark notation.
 
     Returns:
         dict: The alternative labels.
     """
     sub_element_dict = defaultdict(list)
-    for sub_element in element.findall(tag, namespaces=element.nsmap):
-        sub_element_dict[sub_element.get(f"{XML_NAMESPACE}lang")].append(
-            sub_element.text
-        )
+    for sub_element in children.get(tag, ()):
+        sub_element_dict[get_element_language(sub_element)].append(sub_element.text)
     return sub_element_dict
@@ -81,7 +81,9 @@ def add_collections(
         ]
         session.add_all(collections)
         for collection in collections:
-            collection.resolve_members_from_xml(session.query(Member).all())
+            collection.resolve_members_from_xml(
+                {member.iri: member for member in session.query(Member).all()}
+            )
         session.commit()
         return [collection.to_dict() for collection in collections]
 
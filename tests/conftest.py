@@ -3,8 +3,9 @@
 from pathlib import Path
 from typing import Generator
 
-from defusedxml.lxml import parse as parse_xml
 from fastapi.testclient import TestClient
+from lxml.etree import XMLParser  # nosec B410 # pylint: disable=no-name-in-module
+from lxml.etree import parse as parse_xml  # pylint: disable=no-name-in-module
 from owlready2 import onto_path
 from pytest import MonkeyPatch, fixture
 from sqlalchemy.engine import Engine
@@ -31,7 +32,10 @@ def _file_rdf(dir_data: Path) -> Path:
 
 @fixture(name="root_element")
 def _root_element(file_rdf: Path):
-    tree = parse_xml(file_rdf)
+    tree = parse_xml(
+        str(file_rdf),
+        XMLParser(resolve_entities=False, no_network=True),
+    )
     return tree.getroot()
 
 
@@ -51,7 +55,7 @@ def _collection(
 ) -> Collection:
     return Collection.from_xml_element(
         root_element.find("core:Collection", namespaces=root_element.nsmap),
-        [concept_scheme],
+        {concept_scheme.iri: concept_scheme},
     )
 
 
@@ -62,7 +66,7 @@ def _concept(
 ) -> Concept:
     return Concept.from_xml_element(
         root_element.find("core:Concept", namespaces=root_element.nsmap),
-        [concept_scheme],
+        {concept_scheme.iri: concept_scheme},
     )
 
 
@@ -1,22 +1,43 @@
 """Tests for dds_glossary.database module."""
 
+from functools import _lru_cache_wrapper
+from json import loads as json_loads
+
 import pytest
 from sqlalchemy import inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
 from dds_glossary.database import (
     get_collection,
     get_concept,
     get_concept_scheme,
     get_concept_schemes,
+    get_concept_schemes_payload,
+    get_concepts_payload,
+    get_datasets_generation,
+    get_engine_options,
+    get_payload_etag,
     get_relations,
     init_engine,
+    json_serializer,
+    load_concept_schemes_payload,
+    load_concepts_payload,
     save_dataset,
+    save_views,
     search_database,
 )
 from dds_glossary.enums import SemanticRelationType
-from dds_glossary.model import Collection, Concept, ConceptScheme, SemanticRelation
+from dds_glossary.model import (
+    Collection,
+    Concept,
+    ConceptScheme,
+    ConceptSchemesView,
+    DatasetsGeneration,
+    SemanticRelation,
+)
+from dds_glossary.settings import get_settings
 
 from ..common import add_collections, add_concept_schemes, add_concepts, add_relations
 
@@ -41,6 +62,18 @@ def engine_init_checks(engine: Engine) -> None:
     assert inspector.has_table("in_collection")
 
 
+def cache_size(loader: "_lru_cache_wrapper[str]") -> int:
+    """Get the number of entries in the cache of a payload loader.
+
+    Args:
+        loader (_lru_cache_wrapper[str]): The cached payload loader.
+
+    Returns:
+        int: The number of cached payloads.
+    """
+    return loader.cache_info().currsize
+
+
 def test_init_engine_env_var_not_found(monkeypatch) -> None:
     """Test the init_engine function when the DATABASE_URL environment variable is
     not found."""
@@ -50,6 +83,30 @@ def test_init_engine_env_var_not_found(monkeypatch) -> None:
     assert "DATABASE_URL" in str(exc_info.value)
 
 
+def test_get_engine_options(monkeypatch) -> None:
+    """Test the get_engine_options function with a pooled engine."""
+    monkeypatch.setattr(get_settings(), "DATABASE_NULL_POOL", False)
+    options = get_engine_options()
+    assert options["pool_pre_ping"] is True
+    assert options["pool_size"] == 20
+
+
+def test_get_engine_options_null_pool(monkeypatch) -> None:
+    """Test the get_engine_options function when the DATABASE_NULL_POOL setting is
+    enabled."""
+    monkeypatch.setattr(get_settings(), "DATABASE_NULL_POOL", True)
+    engine = init_engine(drop_database_flag=False)
+    assert isinstance(engine.pool, NullPool)
+
+
+def test_json_serializer() -> None:
+    """Test the json_serializer function with labels missing their language."""
+    assert json_loads(json_serializer({"en": "Label", None: "No language"})) == {
+        "en": "Label",
+        "null": "No language",
+    }
+
+
 def test_init_engine_database_not_exists_no_drop() -> None:
     """Test the init_engine function when the database does not exist and
     drop_database_flag is False."""
@@ -129,15 +186,15 @@ def test_save_dataset_with_data(engine: Engine) -> None:
             member_iris=[concept1_iri, concept2_iri],
         ),
     ]
-    semantic_relations = [
-        SemanticRelation(
-            type=SemanticRelationType.BROADER,
-            source_concept_iri=concepts[0].iri,
-            target_concept_iri=concepts[1].iri,
-        )
+    semantic_relation_rows = [
+        {
+            "type": SemanticRelationType.BROADER,
+            "source_concept_iri": concepts[0].iri,
+            "target_concept_iri": concepts[1].iri,
+        }
     ]
 
-    save_dataset(engine, concept_schemes, concepts, collections, semantic_relations)
+    save_dataset(engine, concept_schemes, concepts, collections, semantic_relation_rows)
 
     with Session(engine) as session:
         assert session.query(ConceptScheme).count() == 1
@@ -147,6 +204,103 @@ def test_save_dataset_with_data(engine: Engine) -> None:
         assert session.query(Concept).all()[0].iri == concept1_iri
         assert session.query(SemanticRelation).one().source_concept_iri == concept1_iri
         assert session.query(SemanticRelation).one().target_concept_iri == concept2_iri
+        assert session.query(SemanticRelation).one().type == (
+            SemanticRelationType.BROADER
+        )
+        assert [member.iri for member in session.query(Collection).one().members] == [
+            concept1_iri,
+            concept2_iri,
+        ]
+
+
+def test_save_views(engine: Engine) -> None:
+    """Test the save_views function and the precomputed payloads."""
+    concept_scheme_dicts = add_concept_schemes(engine, 1)
+    scheme_iri = concept_scheme_dicts[0]["iri"]
+    concept_dicts = add_concepts(engine, [scheme_iri, scheme_iri])
+
+    save_views(engine)
+
+    schemes_payload = get_concept_schemes_payload(engine, lang="en")
+    concepts_payload = get_concepts_payload(engine, scheme_iri, lang="en")
+    assert schemes_payload is not None
+    assert concepts_payload is not None
+    assert json_loads(schemes_payload) == concept_scheme_dicts
+    assert sorted(json_loads(concepts_payload), key=lambda c: c["iri"]) == (
+        concept_dicts
+    )
+    assert get_concept_schemes_payload(engine, lang="fr") == schemes_payload
+    assert get_concepts_payload(engine, scheme_iri, lang="fr") == concepts_payload
+
+
+def test_get_payloads_not_precomputed(engine: Engine) -> None:
+    """Test the payload getters when the views have not been saved, which should
+    not cache the missing payloads."""
+    concept_scheme_dicts = add_concept_schemes(engine, 1)
+    load_concept_schemes_payload.cache_clear()
+    load_concepts_payload.cache_clear()
+
+    assert get_concept_schemes_payload(engine) is None
+    assert get_concepts_payload(engine, concept_scheme_dicts[0]["iri"]) is None
+    assert cache_size(load_concept_schemes_payload) == 0
+    assert cache_size(load_concepts_payload) == 0
+
+
+def test_get_payloads_cached_by_stored_lang(engine: Engine) -> None:
+    """Test that the payloads requested in languages without a payload are cached
+    once, under the English payload they fall back to."""
+    concept_scheme_dicts = add_concept_schemes(engine, 1)
+    scheme_iri = concept_scheme_dicts[0]["iri"]
+    add_concepts(engine, [scheme_iri])
+    save_views(engine)
+
+    schemes_payload = get_concept_schemes_payload(engine, lang="x1")
+    concepts_payload = get_concepts_payload(engine, scheme_iri, lang="x1")
+    assert get_concept_schemes_payload(engine, lang="x2") is schemes_payload
+    assert get_concepts_payload(engine, scheme_iri, lang="x2") is concepts_payload
+    assert cache_size(load_concept_schemes_payload) == 1
+    assert cache_size(load_concepts_payload) == 1
+    assert get_concepts_payload(engine, "unknown", lang="x1") is None
+    assert cache_size(load_concepts_payload) == 1
+
+
+def test_get_payloads_cache_cleared_on_save_views(engine: Engine) -> None:
+    """Test that the cached payloads are refreshed when the views are saved."""
+    concept_scheme_dicts = add_concept_schemes(engine, 1)
+    assert get_concept_schemes_payload(engine) is None
+
+    save_views(engine)
+
+    schemes_payload = get_concept_schemes_payload(engine)
+    assert schemes_payload is not None
+    assert json_loads(schemes_payload) == concept_scheme_dicts
+
+
+def test_get_payloads_saved_by_other_worker(engine: Engine) -> None:
+    """Test that the cached payloads are not served once the views have been saved
+    by another worker, which renews the datasets generation without clearing the
+    caches of this process."""
+    add_concept_schemes(engine, 1)
+    save_views(engine)
+    generation = get_datasets_generation(engine)
+    assert generation is not None
+    assert get_concept_schemes_payload(engine) is not None
+
+    with Session(engine) as session:
+        session.query(ConceptSchemesView).update({"payload": []})
+        session.query(DatasetsGeneration).update({"generation": "other"})
+        session.commit()
+
+    assert get_datasets_generation(engine) == "other"
+    assert get_concept_schemes_payload(engine) == "[]"
+
+
+def test_get_payload_etag() -> None:
+    """Test the get_payload_etag function."""
+    etag = get_payload_etag("[]")
+    assert etag.startswith('W/"')
+    assert etag == get_payload_etag("[]")
+    assert etag != get_payload_etag("[{}]")
 
 
 def test_get_concept_schemes(engine: Engine) -> None:
@@ -235,3 +389,15 @@ def test_search_database_no_results(engine: Engine) -> None:
 
     search_results = search_database(engine, "prefLabel2")
     assert len(search_results) == 0
+
+
+def test_search_database_alt_label_fallback_language(engine: Engine) -> None:
+    """Test the search_database on the alternative labels, in a language that falls
+    back to English."""
+    concept_scheme_dicts = add_concept_schemes(engine, 1)
+    scheme_iri = concept_scheme_dicts[0]["iri"]
+    concept_dicts = add_concepts(engine, [scheme_iri, scheme_iri])
+
+    search_results = search_database(engine, concept_dicts[1]["altLabels"][0], "fr")
+    assert len(search_results) == 1
+    assert search_results[0].to_dict() == concept_dicts[1]
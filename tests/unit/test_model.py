@@ -25,6 +25,15 @@ def test_base_eq_true(concept_scheme: ConceptScheme) -> None:
     )
 
 
+def test_base_eq_different_type(
+    concept_scheme: ConceptScheme,
+    concept: Concept,
+) -> None:
+    """It should return False if two Base instances are of different types."""
+    assert concept_scheme != concept
+    assert concept_scheme != concept_scheme.iri
+
+
 def test_base_eq_false(concept_scheme: ConceptScheme) -> None:
     """It should return False if two Base instances are not equal."""
     assert concept_scheme != ConceptScheme(
@@ -78,6 +87,13 @@ def test_base_get_in_language_no_language_specified_no_english(
     assert Base.get_in_language(concept_scheme.prefLabels) == ""
 
 
+def test_base_get_in_language_empty_label(concept_scheme: ConceptScheme) -> None:
+    """It should return the label in the specified language, even without a value,
+    instead of falling back to English."""
+    concept_scheme.prefLabels = {**concept_scheme.prefLabels, "fr": None}
+    assert Base.get_in_language(concept_scheme.prefLabels, "fr") is None
+
+
 def test_base_get_in_language_list_language_exists(concept: Concept) -> None:
     """It should return the preferred label in the specified language."""
     assert Base.get_in_language(concept.altLabels, "sk") == [
@@ -158,10 +174,34 @@ def test_collection_resolve_members_from_xml(
             "en": "Collection2PrefLabel",
         },
     )
-    collection.resolve_members_from_xml([concept, nested_collection])
+    collection.resolve_members_from_xml(
+        {concept.iri: concept, nested_collection.iri: nested_collection}
+    )
     assert len(collection.members) == 2
     assert collection.members[0].to_dict() == concept.to_dict()
     assert collection.members[1].to_dict() == nested_collection.to_dict()
+    assert collection.member_iris == ()
+
+
+def test_collection_iter_in_collection_rows(
+    collection: Collection,
+    concept: Concept,
+) -> None:
+    """It should yield the association rows of the available collection members."""
+    collection.member_iris = (concept.iri, "https://example.org/missing", concept.iri)
+    assert list(collection.iter_in_collection_rows({concept.iri: concept})) == [
+        {"collection_iri": collection.iri, "member_iri": concept.iri},
+    ]
+
+
+def test_concept_scheme_iter_in_scheme_rows(
+    concept_scheme: ConceptScheme,
+    concept: Concept,
+) -> None:
+    """It should yield the association rows of the members of the concept schemes."""
+    assert list(ConceptScheme.iter_in_scheme_rows([concept])) == [
+        {"scheme_iri": concept_scheme.iri, "member_iri": concept.iri},
+    ]
 
 
 def test_concept_from_xml_element(concept: Concept) -> None:
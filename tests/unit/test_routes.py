@@ -1,15 +1,148 @@
 """Tests for dds_glossary.routes module."""
 
+from gzip import decompress as gzip_decompress
 from http import HTTPStatus
+from json import loads as json_loads
 
+from fastapi import Request
 from fastapi.testclient import TestClient
+from orjson import dumps as orjson_dumps
 from pytest import MonkeyPatch
 
 from dds_glossary.model import Dataset, FailedDataset
-from dds_glossary.schema import InitDatasetsResponse, VersionResponse
+from dds_glossary.routes import (
+    GZIP_MINIMUM_SIZE,
+    accepts_gzip,
+    json_response,
+    payload_response,
+)
+from dds_glossary.schema import (
+    CollectionResponse,
+    ConceptResponse,
+    EntityResponse,
+    InitDatasetsResponse,
+    VersionResponse,
+)
+from dds_glossary.services import GlossaryController
 from dds_glossary.settings import get_settings
 
 
+def test_json_response() -> None:
+    """Test the json_response function with nested response models."""
+    collection = CollectionResponse(
+        iri="collection",
+        notation="Collection Notation",
+        prefLabel="Collection Pref Label",
+        collections=[EntityResponse(iri="sub", notation="", prefLabel="")],
+        concepts=[
+            ConceptResponse(
+                iri="concept",
+                notation="",
+                prefLabel="",
+                identifier="",
+                scopeNote="",
+                altLabels=["Alt Label"],
+            )
+        ],
+    )
+
+    response = json_response([collection])
+    assert response.media_type == "application/json"
+    assert json_loads(response.body) == [collection.model_dump()]
+
+
+def test_payload_response() -> None:
+    """Test the payload_response function with and without a matching entity
+    tag."""
+    payload = '[{"iri": "iri"}]'
+    response = payload_response(Request({"type": "http", "headers": []}), payload)
+    assert response.status_code == HTTPStatus.OK
+    assert response.body == payload.encode()
+    etag = response.headers["etag"]
+
+    response = payload_response(
+        Request(
+            {
+                "type": "http",
+                "headers": [(b"if-none-match", f'"other", {etag}'.encode())],
+            }
+        ),
+        payload,
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.body == b""
+
+
+def test_accepts_gzip() -> None:
+    """Test the accepts_gzip function with the codings and q-values of the
+    Accept-Encoding header."""
+
+    def request(accept_encoding: str) -> Request:
+        return Request(
+            {
+                "type": "http",
+                "headers": [(b"accept-encoding", accept_encoding.encode())],
+            }
+        )
+
+    assert accepts_gzip(request("gzip, br")) is True
+    assert accepts_gzip(request("br;q=1.0, GZIP;q=0.5")) is True
+    assert accepts_gzip(request("*")) is True
+    assert accepts_gzip(request("gzip;q=0")) is False
+    assert accepts_gzip(request("gzip;q=0, *")) is False
+    assert accepts_gzip(request("br, identity")) is False
+    assert accepts_gzip(Request({"type": "http", "headers": []})) is False
+
+
+def test_payload_response_gzip() -> None:
+    """Test the payload_response function with a client accepting gzip, below and
+    above the minimum size."""
+    request = Request({"type": "http", "headers": [(b"accept-encoding", b"gzip, br")]})
+    payload = '[{"iri": "iri"}]'
+    response = payload_response(request, payload)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-encoding"] == "identity"
+    assert response.body == payload.encode()
+
+    payload = orjson_dumps([{"iri": f"iri{i}"} for i in range(200)]).decode()
+    assert len(payload) >= GZIP_MINIMUM_SIZE
+    response = payload_response(request, payload)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert gzip_decompress(response.body) == payload.encode()
+
+
+def test_get_concept_schemes_gzip_declined(
+    client: TestClient,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the gzip middleware does not compress a payload declined by the
+    client with a zero q-value."""
+    payload = orjson_dumps([{"iri": f"iri{i}"} for i in range(200)]).decode()
+    assert len(payload) >= GZIP_MINIMUM_SIZE
+    monkeypatch.setattr(
+        GlossaryController,
+        "get_concept_schemes_payload",
+        lambda _self, lang="en": payload,
+    )
+    response = client.get(
+        "/latest/schemes",
+        headers={"Accept-Encoding": "gzip;q=0"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-encoding"] == "identity"
+    assert response.headers.get_list("vary") == ["Accept-Encoding"]
+    assert response.content == payload.encode()
+
+    response = client.get("/latest/schemes", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers.get_list("vary") == ["Accept-Encoding"]
+    assert response.content == payload.encode()
+
+
 def test_version(
     client: TestClient,
     version_response: VersionResponse,
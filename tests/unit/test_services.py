@@ -6,12 +6,13 @@ from pathlib import Path
 from pytest import MonkeyPatch
 from pytest import raises as pytest_raises
 
+from dds_glossary.enums import SemanticRelationType
 from dds_glossary.exceptions import (
     CollectionNotFoundException,
     ConceptNotFoundException,
     ConceptSchemeNotFoundException,
 )
-from dds_glossary.model import Dataset, FailedDataset
+from dds_glossary.model import Collection, Concept, Dataset, FailedDataset
 from dds_glossary.schema import (
     CollectionResponse,
     ConceptResponse,
@@ -20,18 +21,11 @@ from dds_glossary.schema import (
     FullConceptSchemeResponse,
     RelationResponse,
 )
-from dds_glossary.services import GlossaryController
+from dds_glossary.services import DATASET_WORKERS, GlossaryController, get_templates
 
 from ..common import add_collections, add_concept_schemes, add_concepts, add_relations
 
 
-def _init_datasets(_monkeypatch: MonkeyPatch) -> None:
-    _monkeypatch.setattr("dds_glossary.database.save_dataset", lambda *_, **__: None)
-    _monkeypatch.setattr(
-        GlossaryController, "parse_dataset", lambda *_, **__: ([], [], [], [])
-    )
-
-
 def test_glossary_controller_parse_dataset(
     controller: GlossaryController,
     file_rdf: Path,
@@ -42,21 +36,24 @@ def test_glossary_controller_parse_dataset(
     concept2_iri = "http://data.europa.eu/xsp/cn2024/020321000010"
     collection1_iri = "https://example.org/collection1"
     collection2_iri = "https://example.org/collection2"
-    concept_schemes, concepts, collections, semantic_relations = (
+    concept_schemes, concepts, collections, semantic_relation_rows = (
         controller.parse_dataset(dataset_path=file_rdf)
     )
 
     assert len(concept_schemes) == 1
     assert len(concepts) == 2
     assert len(collections) == 2
-    assert len(semantic_relations) == 1
+    assert len(semantic_relation_rows) == 1
     assert concept_schemes[0].iri == concept_scheme_iri
     assert concepts[0].iri == concept1_iri
     assert concepts[1].iri == concept2_iri
     assert collections[0].iri == collection1_iri
     assert collections[1].iri == collection2_iri
-    assert semantic_relations[0].source_concept_iri == concept1_iri
-    assert semantic_relations[0].target_concept_iri == concept2_iri
+    assert semantic_relation_rows[0] == {
+        "type": SemanticRelationType.BROADER,
+        "source_concept_iri": concept1_iri,
+        "target_concept_iri": concept2_iri,
+    }
 
 
 def test_init_dataset_with_failed_datasets(
@@ -64,12 +61,16 @@ def test_init_dataset_with_failed_datasets(
     monkeypatch: MonkeyPatch,
     file_rdf: Path,
 ) -> None:
-    """Test the GlossaryController init_datasets method with an exception."""
-    _init_datasets(monkeypatch)
-    GlossaryController.datasets = [
-        Dataset(name="sample.rdf", url=str(file_rdf)),
-        Dataset(name="test.rdf", url="test.rdf"),
-    ]
+    """Test the GlossaryController init_datasets method with a dataset that fails to
+    download, while the other one is downloaded, parsed and saved."""
+    monkeypatch.setattr(
+        GlossaryController,
+        "datasets",
+        [
+            Dataset(name="sample.rdf", url=str(file_rdf)),
+            Dataset(name="test.rdf", url="test.rdf"),
+        ],
+    )
 
     response = controller.init_datasets()
     files = list(controller.data_dir.iterdir())
@@ -96,6 +97,56 @@ def test_init_dataset_with_failed_datasets(
     assert response.saved_datasets == [Dataset(name="sample.rdf", url=str(file_rdf))]
 
 
+def test_init_dataset_with_saved_dataset(
+    controller: GlossaryController,
+    monkeypatch: MonkeyPatch,
+    file_rdf: Path,
+) -> None:
+    """Test the GlossaryController init_datasets method with an already saved
+    dataset, which should not be downloaded again."""
+    dataset = Dataset(name="sample.rdf", url="not_downloaded.rdf")
+    monkeypatch.setattr(GlossaryController, "datasets", [dataset])
+    (controller.data_dir / dataset.name).write_bytes(file_rdf.read_bytes())
+
+    response = controller.init_datasets()
+
+    assert response.failed_datasets == []
+    assert response.saved_datasets == [dataset]
+
+
+def test_split_scheme_members() -> None:
+    """Test the GlossaryController split_scheme_members method."""
+    collection = Collection(iri="collection", notation="", prefLabels={})
+    concepts = [
+        Concept(iri=f"concept{index}", notation="", prefLabels={}) for index in range(2)
+    ]
+
+    assert GlossaryController.split_scheme_members(
+        [concepts[0], collection, concepts[1]]
+    ) == ([collection], concepts)
+
+
+def test_init_dataset_more_datasets_than_workers(
+    controller: GlossaryController,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test the GlossaryController init_datasets method with more datasets than
+    worker processes, which should all be processed in order."""
+    datasets = [
+        Dataset(name=f"missing{index}.rdf", url=f"missing{index}.rdf")
+        for index in range(DATASET_WORKERS + 1)
+    ]
+    monkeypatch.setattr(GlossaryController, "datasets", datasets)
+
+    response = controller.init_datasets()
+
+    assert response.saved_datasets == []
+    assert [
+        Dataset(name=failed_dataset.name, url=failed_dataset.url)
+        for failed_dataset in response.failed_datasets
+    ] == datasets
+
+
 def test_get_concept_schemes(controller: GlossaryController) -> None:
     """Test the GlossaryController get_concept_schemes method."""
     concept_scheme_dicts = add_concept_schemes(controller.engine, 1)
@@ -226,6 +277,31 @@ def test_get_concept(controller: GlossaryController) -> None:
 
     concept = controller.get_concept(concept_dicts[0]["iri"])
     assert concept == expected_concept
+    assert controller.get_concept(concept_dicts[0]["iri"]) is concept
+
+
+def test_get_concept_cache_cleared_on_init_datasets(
+    controller: GlossaryController,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that the cached concepts are dropped by every controller when the
+    datasets are initialized again by any of them."""
+    concept_scheme_dicts = add_concept_schemes(controller.engine, 1)
+    concept_dicts = add_concepts(controller.engine, [concept_scheme_dicts[0]["iri"]])
+    other_controller = GlossaryController(
+        data_dir_path=controller.data_dir,
+        engine=controller.engine,
+    )
+    controller.get_concept(concept_dicts[0]["iri"])
+    other_controller.get_concept(concept_dicts[0]["iri"])
+    monkeypatch.setattr(GlossaryController, "datasets", [])
+
+    controller.init_datasets()
+
+    with pytest_raises(ConceptNotFoundException):
+        controller.get_concept(concept_dicts[0]["iri"])
+    with pytest_raises(ConceptNotFoundException):
+        other_controller.get_concept(concept_dicts[0]["iri"])
 
 
 def test_get_concept_not_found(controller: GlossaryController) -> None:
@@ -246,3 +322,11 @@ def test_search_database(controller: GlossaryController) -> None:
     search_results = controller.search_database(concept_dicts[0]["prefLabel"])
     assert len(search_results) == 1
     assert search_results[0].model_dump() == concept_dicts[0]
+
+
+def test_get_templates() -> None:
+    """Test that get_templates returns a shared, non auto-reloading environment."""
+    templates = get_templates()
+    assert templates is get_templates()
+    assert templates.env.auto_reload is False
+    assert templates.env.bytecode_cache is not None